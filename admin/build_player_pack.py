@@ -0,0 +1,21 @@
+import sys
+import os
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from pathlib import Path
+
+from app.client.controllers.asset_pack import AssetPack
+
+PLAYERS_DIR = Path(PROJECT_ROOT) / "app" / "client" / "assets" / "players"
+PACK_PATH = Path(PROJECT_ROOT) / "app" / "client" / "assets" / "players.pack"
+
+def main():
+    count = AssetPack.write_pack(PLAYERS_DIR, PACK_PATH)
+    size_kb = PACK_PATH.stat().st_size // 1024
+    print(f"Packed {count} player portraits into {PACK_PATH} ({size_kb} KB).")
+
+if __name__ == "__main__":
+    main()
@@ -41,7 +41,7 @@ a = Analysis(
         ('app/client/assets/fonts',   'app/client/assets/fonts.'),
         ('app/client/assets/icons',   'app/client/assets/icons.'),
         ('app/client/assets/images',  'app/client/assets/images.'),
-        ('app/client/assets/players', 'app/client/assets/players.'),
+        ('app/client/assets/players.pack', 'app/client/assets'),
         ('app/client/assets/sounds',  'app/client/assets/sounds.'),
         ('app/client/assets/texts',   'app/client/assets/texts.')
     ],
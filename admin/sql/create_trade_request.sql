@@ -0,0 +1,127 @@
+-- create_trade_request(p_initiator_id, p_receiver_id, p_initiator_player, p_receiver_player)
+--
+-- Validates and inserts a player-to-player trade request in one call: there
+-- is an open trade window, both managers share a league and own a team, each
+-- currently rosters the player being offered, and neither has used up their
+-- two trades for the window. Returns the new request_id.
+--
+-- Both offered team_players rows are locked FOR UPDATE before the checks.
+-- A trade being accepted at the same time has to update those rows to
+-- move either player, so it waits until this request is inserted. The
+-- trade counts themselves aren't locked.
+--
+-- Called from TradeService.create_player_request via
+-- supabase.rpc("create_trade_request", ...). As with draft_pick, the
+-- initiator must match the caller's JWT when one is present.
+
+create or replace function create_trade_request(
+    p_initiator_id      uuid,
+    p_receiver_id       uuid,
+    p_initiator_player  text,
+    p_receiver_player   text
+)
+returns uuid
+language plpgsql
+security definer
+set search_path = public
+as $$
+declare
+    v_claims            text := nullif(current_setting('request.jwt.claims', true), '');
+    v_window_id         uuid;
+    v_league_id         uuid;
+    v_receiver_league   uuid;
+    v_initiator_team    uuid;
+    v_receiver_team     uuid;
+    v_request_id        uuid;
+begin
+    if v_claims is not null and (v_claims::json ->> 'sub')::uuid is distinct from p_initiator_id then
+        raise exception 'You can only offer trades from your own team!';
+    end if;
+
+    select id into v_window_id
+    from trade_windows
+    where start_date <= now() and end_date >= now()
+    limit 1;
+    if v_window_id is null then
+        raise exception 'You are not in an active trade window!';
+    end if;
+
+    select league_id into v_league_id from managers where user_id = p_initiator_id;
+    if v_league_id is null then
+        raise exception 'You are not in a league!';
+    end if;
+
+    select league_id into v_receiver_league from managers where user_id = p_receiver_id;
+    if not found then
+        raise exception 'Receiver not found.';
+    end if;
+    if v_receiver_league is distinct from v_league_id then
+        raise exception 'You are not in the same league as the receiver!';
+    end if;
+
+    select team_id into v_initiator_team
+    from teams
+    where league_id = v_league_id and team_owner = p_initiator_id;
+    if v_initiator_team is null then
+        raise exception 'You do not have a team!';
+    end if;
+
+    perform 1 from team_players
+    where team_id = v_initiator_team
+      and player_name = p_initiator_player
+      and left_at is null
+    for update;
+    if not found then
+        raise exception 'You do not own %!', p_initiator_player;
+    end if;
+
+    select team_id into v_receiver_team
+    from teams
+    where league_id = v_league_id and team_owner = p_receiver_id;
+    if v_receiver_team is null then
+        raise exception 'Receiver does not have a team!';
+    end if;
+
+    perform 1 from team_players
+    where team_id = v_receiver_team
+      and player_name = p_receiver_player
+      and left_at is null
+    for update;
+    if not found then
+        raise exception 'Receiver does not own %!', p_receiver_player;
+    end if;
+
+    if (
+        select count(*) from trades
+        where league_id = v_league_id
+          and trade_window_id = v_window_id
+          and p_initiator_id in (initiator_id, receiver_id)
+    ) >= 2 then
+        raise exception 'You have reached the trade limit for this window.';
+    end if;
+
+    if (
+        select count(*) from trades
+        where league_id = v_league_id
+          and trade_window_id = v_window_id
+          and p_receiver_id in (initiator_id, receiver_id)
+    ) >= 2 then
+        raise exception 'Receiver has reached the trade limit for this window.';
+    end if;
+
+    insert into trade_requests (
+        initiator_id, receiver_id, league_id,
+        initiator_player, receiver_player, trade_window_id
+    )
+    values (
+        p_initiator_id, p_receiver_id, v_league_id,
+        p_initiator_player, p_receiver_player, v_window_id
+    )
+    returning request_id into v_request_id;
+
+    return v_request_id;
+end;
+$$;
+
+revoke all on function create_trade_request(uuid, uuid, text, text) from public;
+grant execute on function create_trade_request(uuid, uuid, text, text) to authenticated;
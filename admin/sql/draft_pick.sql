@@ -0,0 +1,117 @@
+-- draft_pick(p_user_id, p_player_name)
+--
+-- Makes one draft pick as a single transaction: validates the league is mid
+-- draft, that it's p_user_id's turn, that the player exists and is free in
+-- the league and that the team has room, then inserts the pick and advances
+-- the snake order. The league row is locked for the duration, so two picks in
+-- the same league can't both read the same pick_turn.
+--
+-- Called from TeamService.pick_player via supabase.rpc("draft_pick", ...).
+-- Under PostgREST p_user_id must match the caller's JWT; without a JWT (a
+-- plain local Postgres with the same tables) the check is skipped, so the
+-- function can be exercised directly with psql:
+--
+--     select draft_pick('<user uuid>', 'MenaRD');
+
+create or replace function draft_pick(p_user_id uuid, p_player_name text)
+returns boolean
+language plpgsql
+security definer
+set search_path = public
+as $$
+declare
+    v_claims      text := nullif(current_setting('request.jwt.claims', true), '');
+    v_league_id   uuid;
+    v_team_id     uuid;
+    v_league      leagues%rowtype;
+    v_team_count  int;
+    v_idx         int;
+    v_next_idx    int;
+    v_direction   int;
+    v_order_len   int;
+begin
+    if v_claims is not null and (v_claims::json ->> 'sub')::uuid is distinct from p_user_id then
+        raise exception 'You can only pick for your own team!';
+    end if;
+
+    select league_id into v_league_id from managers where user_id = p_user_id;
+    if v_league_id is null then
+        raise exception 'You are not in a league!';
+    end if;
+
+    select team_id into v_team_id from teams where team_owner = p_user_id;
+    if v_team_id is null then
+        raise exception 'You do not have a team!';
+    end if;
+
+    -- serialises picks within the league
+    select * into v_league from leagues where league_id = v_league_id for update;
+
+    if not v_league.locked then
+        raise exception 'The draft hasn''t begun yet!';
+    end if;
+    if v_league.draft_complete then
+        raise exception 'The draft is over!';
+    end if;
+    if v_league.pick_turn is distinct from p_user_id then
+        raise exception 'It''s not your turn to pick a player!';
+    end if;
+
+    if not exists (select 1 from players where name = p_player_name) then
+        raise exception 'Entered player is not in the player pool!';
+    end if;
+
+    select count(*) into v_team_count
+    from team_players
+    where team_id = v_team_id and left_at is null;
+
+    if v_team_count >= 5 then
+        raise exception 'This team is full!';
+    end if;
+    if exists (
+        select 1 from team_players
+        where league_id = v_league_id and player_name = p_player_name
+    ) then
+        raise exception 'This player has already been picked!';
+    end if;
+
+    -- draft_order is a jsonb list of user IDs (see assign_draft_order),
+    -- indexed from 0 here
+    v_order_len := jsonb_array_length(v_league.draft_order);
+    select t.ord - 1 into v_idx
+    from jsonb_array_elements_text(v_league.draft_order) with ordinality as t(user_id, ord)
+    where t.user_id::uuid = p_user_id;
+
+    if v_idx is null then
+        raise exception 'You are not in this league''s draft order!';
+    end if;
+
+    -- snake order: at either end the same manager picks twice and the
+    -- direction flips; turning back after a 5th pick ends the draft
+    v_direction := v_league.pick_direction;
+    v_next_idx  := v_idx + v_direction;
+
+    if v_next_idx >= v_order_len or v_next_idx < 0 then
+        v_direction := -v_direction;
+        v_next_idx  := v_idx;
+
+        if v_direction = -1 and v_team_count = 4 then
+            v_league.draft_complete := true;
+        end if;
+    end if;
+
+    update leagues
+    set pick_turn      = (v_league.draft_order ->> v_next_idx)::uuid,
+        pick_direction = v_direction,
+        draft_complete = v_league.draft_complete
+    where league_id = v_league_id;
+
+    insert into team_players (league_id, team_id, player_name)
+    values (v_league_id, v_team_id, p_player_name);
+
+    return true;
+end;
+$$;
+
+revoke all on function draft_pick(uuid, text) from public;
+grant execute on function draft_pick(uuid, text) to authenticated;
@@ -0,0 +1,61 @@
+-- get_league_standings(p_league_id, p_limit, p_offset)
+--
+-- Per-team standings for a league, aggregated server side: team and owner,
+-- active roster, former players and total points (active + former), ordered
+-- by total points. Teams with no roster history are left out, as before.
+-- p_limit / p_offset page through teams; a null limit returns them all.
+--
+-- Called from LeaderboardService.get_leaguemate_standings via
+-- supabase.rpc("get_league_standings", ...). Returns the same list of dicts
+-- the client used to build itself.
+
+create or replace function get_league_standings(
+    p_league_id uuid,
+    p_limit     int default null,
+    p_offset    int default 0
+)
+returns jsonb
+language sql
+stable
+set search_path = public
+as $$
+    select coalesce(jsonb_agg(s.standing order by s.total_points desc, s.team_name), '[]'::jsonb)
+    from (
+        select
+            t.team_name,
+            sum(tp.points) as total_points,
+            jsonb_build_object(
+                'team_name', t.team_name,
+                'user_name', m.manager_name,
+                'user_id', m.user_id,
+                'players', coalesce(
+                    jsonb_agg(jsonb_build_object(
+                        'player_name', tp.player_name,
+                        'points', tp.points,
+                        'joined_at', tp.joined_at
+                    ) order by tp.joined_at) filter (where tp.left_at is null),
+                    '[]'::jsonb
+                ),
+                'former_players', coalesce(
+                    jsonb_agg(jsonb_build_object(
+                        'player_name', tp.player_name,
+                        'points', tp.points,
+                        'joined_at', tp.joined_at,
+                        'left_at', tp.left_at
+                    ) order by tp.left_at) filter (where tp.left_at is not null),
+                    '[]'::jsonb
+                ),
+                'total_points', sum(tp.points)
+            ) as standing
+        from teams t
+        join team_players tp on tp.team_id = t.team_id
+        left join managers m on m.user_id = t.team_owner
+        where t.league_id = p_league_id
+        group by t.team_id, t.team_name, m.manager_name, m.user_id
+        order by total_points desc, t.team_name
+        limit p_limit
+        offset p_offset
+    ) s;
+$$;
+
+grant execute on function get_league_standings(uuid, int, int) to authenticated;
@@ -0,0 +1,30 @@
+-- get_pool_players(p_league_id)
+--
+-- Players not currently rostered by any team in the league, as one anti-join
+-- instead of shipping the league's claimed names back in a not.in filter.
+-- Matches the old client behaviour of returning nothing for a league with
+-- no active roster entries (i.e. before the draft).
+--
+-- Called from TradeService.get_pool_players via supabase.rpc("get_pool_players", ...).
+
+create or replace function get_pool_players(p_league_id uuid)
+returns setof players
+language sql
+stable
+set search_path = public
+as $$
+    select p.*
+    from players p
+    where exists (
+        select 1 from team_players
+        where league_id = p_league_id and left_at is null
+    )
+    and not exists (
+        select 1 from team_players tp
+        where tp.league_id = p_league_id
+          and tp.player_name = p.name
+          and tp.left_at is null
+    );
+$$;
+
+grant execute on function get_pool_players(uuid) to authenticated;
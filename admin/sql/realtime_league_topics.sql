@@ -0,0 +1,79 @@
+-- Realtime broadcasts for the draft and trade topics RealtimeListener joins
+-- alongside history and chat:
+--
+--     league:<league_id>:draft    leagues row changes during the draft
+--                                 (pick_turn, direction, lock, completion)
+--     league:<league_id>:trades   trade requests created / removed and
+--                                 trades completed
+--
+-- The client treats these as invalidations (see Session.REALTIME_INVALIDATIONS),
+-- which is what lets it poll every few minutes instead of every 10 seconds
+-- during a draft.
+
+create or replace function broadcast_league_draft()
+returns trigger
+language plpgsql
+security definer
+set search_path = public
+as $$
+begin
+    if (new.pick_turn, new.pick_direction, new.locked, new.draft_complete, new.draft_order)
+        is distinct from
+       (old.pick_turn, old.pick_direction, old.locked, old.draft_complete, old.draft_order)
+    then
+        perform realtime.broadcast_changes(
+            'league:' || new.league_id || ':draft',
+            tg_op, tg_op, tg_table_name, tg_table_schema, new, old
+        );
+    end if;
+    return null;
+end;
+$$;
+
+drop trigger if exists leagues_broadcast_draft on leagues;
+create trigger leagues_broadcast_draft
+    after update on leagues
+    for each row execute function broadcast_league_draft();
+
+
+create or replace function broadcast_league_trades()
+returns trigger
+language plpgsql
+security definer
+set search_path = public
+as $$
+declare
+    v_row record := coalesce(new, old);
+begin
+    perform realtime.broadcast_changes(
+        'league:' || v_row.league_id || ':trades',
+        tg_op, tg_op, tg_table_name, tg_table_schema, new, old
+    );
+    return null;
+end;
+$$;
+
+drop trigger if exists trade_requests_broadcast on trade_requests;
+create trigger trade_requests_broadcast
+    after insert or delete on trade_requests
+    for each row execute function broadcast_league_trades();
+
+drop trigger if exists trades_broadcast on trades;
+create trigger trades_broadcast
+    after insert on trades
+    for each row execute function broadcast_league_trades();
+
+
+-- private channels: league members may receive any of their league's topics
+drop policy if exists "league members receive league topics" on realtime.messages;
+create policy "league members receive league topics"
+    on realtime.messages
+    for select
+    to authenticated
+    using (
+        exists (
+            select 1 from managers m
+            where m.user_id = auth.uid()
+              and realtime.topic() like 'league:' || m.league_id || ':%'
+        )
+    );
@@ -1,7 +1,7 @@
 from PyQt6.QtWidgets import QMainWindow, QApplication, QStackedWidget
 from PyQt6.QtGui import QKeySequence, QShortcut
 
-from PyQt6.QtCore import QEvent
+from PyQt6.QtCore import QEvent, pyqtSignal
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtWidgets import (
     QApplication,
@@ -13,6 +13,7 @@ from PyQt6.QtWidgets import (
     QAbstractSpinBox
 )
 
+from app.client.controllers.async_runner import run_async
 from app.client.controllers.sound_manager import SoundManager
 from app.client.views.global_view import GlobalView
 from app.client.views.trade_view import TradeView
@@ -45,10 +46,17 @@ from PyQt6.QtWidgets import (
 
 
 class FantasyApp(QMainWindow):
+    # Session._on_block; Session can hit a block from pool threads, the
+    # signal gets the footer refresh onto the GUI thread
+    blocked = pyqtSignal()
+    # Session._dispatch; queues a callable onto the GUI thread
+    dispatch = pyqtSignal(object)
+
     def __init__(self):
         super().__init__()
         QApplication.instance().installEventFilter(self)
         self._active_threads = []
+        self._refreshing = False
         self.blue_screen = BlueScreen(self)
 
         QShortcut(QKeySequence("Ctrl+W"), self).activated.connect(self.close)
@@ -58,6 +66,9 @@ class FantasyApp(QMainWindow):
         self.header = HeaderBar(self)
         self.footer = FooterNav(self)
         self.stack = QStackedWidget()
+        self.blocked.connect(self.footer.refresh)
+        self.dispatch.connect(self._run_dispatched)
+        Session._dispatch = self.dispatch.emit
 
         central = QWidget()
         central_layout = QVBoxLayout(central)
@@ -136,7 +147,7 @@ class FantasyApp(QMainWindow):
 
     def show_home_view(self):
         if not Session._on_block:
-            Session._on_block = lambda: self.footer.refresh()
+            Session._on_block = self.blocked.emit
             self.footer.refresh()
             self.header.refresh()
 
@@ -167,7 +178,7 @@ class FantasyApp(QMainWindow):
             QApplication.processEvents()
             self.stack.setCurrentWidget(self.league_view)
             SoundManager.play("loaded")
-            self.connect_refresh(lambda: self.league_view._refresh(force=1))
+            self.connect_refresh(LeagueView.fetch, lambda: self.league_view._refresh(fetch=False))
             return
 
         blocked = False
@@ -188,7 +199,7 @@ class FantasyApp(QMainWindow):
             self.league_view = LeagueView(app=self)
             self.stack.addWidget(self.league_view)
             SoundManager.play("loaded")
-            self.connect_refresh(lambda: self.league_view._refresh(force=1))
+            self.connect_refresh(LeagueView.fetch, lambda: self.league_view._refresh(fetch=False))
 
         load_view(self.stack, self.loading_view, _fetch, _done, self._active_threads)
 
@@ -201,7 +212,7 @@ class FantasyApp(QMainWindow):
             QApplication.processEvents()
             self.stack.setCurrentWidget(self.leaderboard_view)
             SoundManager.play("loaded")
-            self.connect_refresh(lambda: self.leaderboard_view._refresh(force=1))
+            self.connect_refresh(LeaderboardView.fetch, lambda: self.leaderboard_view._refresh(fetch=False))
             return
 
         blocked = False
@@ -221,7 +232,7 @@ class FantasyApp(QMainWindow):
             self.leaderboard_view = LeaderboardView(app=self)
             self.stack.addWidget(self.leaderboard_view)
             SoundManager.play("loaded")
-            self.connect_refresh(lambda: self.leaderboard_view._refresh(force=1))
+            self.connect_refresh(LeaderboardView.fetch, lambda: self.leaderboard_view._refresh(fetch=False))
 
         load_view(self.stack, self.loading_view, _fetch, _done, self._active_threads)
 
@@ -234,7 +245,7 @@ class FantasyApp(QMainWindow):
             QApplication.processEvents()
             self.stack.setCurrentWidget(self.trades_view)
             SoundManager.play("loaded")
-            self.connect_refresh(lambda: self.trades_view._refresh(force=1))
+            self.connect_refresh(TradeView.fetch, lambda: self.trades_view._refresh(fetch=False))
             return
 
         blocked = False
@@ -247,6 +258,7 @@ class FantasyApp(QMainWindow):
                 return
             Session.init_trade_data(force=1)
             Session.init_leaderboards(force=1)
+            TradeView.preload()
 
         def _done():
             if blocked:
@@ -255,7 +267,7 @@ class FantasyApp(QMainWindow):
             self.trades_view = TradeView(app=self)
             self.stack.addWidget(self.trades_view)
             SoundManager.play("loaded")
-            self.connect_refresh(lambda: self.trades_view._refresh(force=1))
+            self.connect_refresh(TradeView.fetch, lambda: self.trades_view._refresh(fetch=False))
 
         load_view(self.stack, self.loading_view, _fetch, _done, self._active_threads)
 
@@ -378,29 +390,58 @@ class FantasyApp(QMainWindow):
 
 # -- REFRESH --
 
-    def connect_refresh(self, callback):
+    def _run_dispatched(self, fn):
+        fn()
+
+    def connect_refresh(self, fetch, apply):
+        '''
+        Wires the header refresh button to a view. fetch(force) does the
+        network work off the GUI thread; apply() rebuilds the view from
+        Session once it's done.
+        '''
         try:
             self.header.refresh_button.refresh_requested.disconnect()
         except Exception:
             pass
         self.header.refresh_button.refresh_requested.connect(
-            lambda: self._do_refresh(callback, manual=True)
+            lambda: self._do_refresh(fetch, apply, manual=True)
         )
 
-    def _do_refresh(self, callback, manual=False):
+    def _do_refresh(self, fetch, apply, manual=False):
+        # presses while a refresh is in flight are dropped
+        if self._refreshing:
+            return
+        self._refreshing = True
+
         view = self.stack.currentWidget()
-        try:
-            if manual:
-                set_status(view, "Refreshing...", code=0)
-            view.setEnabled(False)
-            self.header.setEnabled(False)
-            QApplication.processEvents()
-            callback()
-            if manual:
-                set_status(view, "Refreshed!", code=1)
-        except Exception as e:
+        if manual:
+            set_status(view, "Refreshing...", code=0)
+        self.header.set_refreshing(True)
+
+        def _success(_):
+            try:
+                apply()
+                if manual:
+                    set_status(view, "Refreshed!", code=1)
+            except Exception as e:
+                if manual:
+                    set_status(view, f"Refresh failed: {e}", code=2)
+
+        def _error(e):
             if manual:
                 set_status(view, f"Refresh failed: {e}", code=2)
-        finally:
-            view.setEnabled(True)
-            self.header.setEnabled(True)
+
+        def _finished():
+            self._refreshing = False
+            self.header.set_refreshing(False)
+
+        run_async(
+            parent_widget=view,
+            fn=fetch,
+            kwargs={"force": 1},
+            block_cursor=False,
+            on_success=_success,
+            on_error=_error,
+            on_finished=_finished,
+            key="manual_refresh",
+        )
@@ -0,0 +1,81 @@
+import json
+import mmap
+import struct
+from pathlib import Path
+from typing import Optional
+
+# file layout: MAGIC | uint32 index length | json index | blobs
+# the index maps key -> [offset, length], offsets relative to the blob start
+MAGIC = b"SF6PACK1"
+_HEADER = struct.Struct("<8sI")
+
+
+class AssetPack:
+    """
+    Read-only pack of many small assets stored in one file, memory-mapped so
+    lookups are a dict hit plus a slice instead of filesystem probes.
+
+    Packs are built ahead of time with `write_pack` (see
+    admin/build_player_pack.py) and shipped in place of the loose files.
+    """
+
+    def __init__(self, path: Path):
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, index_len = _HEADER.unpack_from(self._map, 0)
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not an asset pack")
+            index_end = _HEADER.size + index_len
+            self._index = json.loads(self._map[_HEADER.size:index_end])
+            self._data_start = index_end
+        except Exception:
+            self._file.close()
+            raise
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def keys(self):
+        return self._index.keys()
+
+    def get(self, key: str) -> Optional[memoryview]:
+        """Return a zero-copy view of the asset's bytes, or None."""
+        entry = self._index.get(key)
+        if entry is None:
+            return None
+        offset, length = entry
+        start = self._data_start + offset
+        return memoryview(self._map)[start:start + length]
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    @staticmethod
+    def write_pack(source_dir: Path, out_path: Path, extensions=(".jpg", ".png", ".webp")) -> int:
+        """
+        Packs every file in source_dir with a matching extension into
+        out_path, keyed by file stem. Returns the number of assets packed.
+        """
+        index = {}
+        blobs = []
+        offset = 0
+        for path in sorted(Path(source_dir).iterdir()):
+            if path.suffix.lower() not in extensions or path.stem in index:
+                continue
+            data = path.read_bytes()
+            index[path.stem] = [offset, len(data)]
+            blobs.append(data)
+            offset += len(data)
+
+        index_bytes = json.dumps(index, separators=(",", ":")).encode("utf-8")
+        tmp_path = Path(out_path).with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, len(index_bytes)))
+            f.write(index_bytes)
+            for data in blobs:
+                f.write(data)
+        tmp_path.replace(out_path)
+
+        return len(index)
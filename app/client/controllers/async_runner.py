@@ -1,6 +1,7 @@
 from PyQt6.QtCore import (
-    QObject, 
-    QThread, 
+    QObject,
+    QRunnable,
+    QThreadPool,
     pyqtSignal
 )
 
@@ -8,27 +9,140 @@ from PyQt6.QtWidgets import QApplication
 
 from PyQt6.QtCore import Qt
 
-class _Worker(QObject):
-    finished = pyqtSignal()
+# shared pool for every run_async call, so rapid clicks queue instead of
+# spawning a thread each
+MAX_WORKERS = 6
+
+_pool = None
+
+# key -> _Task currently queued or running for that key
+_keyed = {}
+
+# keeps tasks (and their signal objects) alive until they report back
+_running = set()
+
+
+def _get_pool():
+    global _pool
+    if _pool is None:
+        _pool = QThreadPool()
+        _pool.setMaxThreadCount(MAX_WORKERS)
+    return _pool
+
+
+class _Signals(QObject):
     success = pyqtSignal(object)
     error = pyqtSignal(Exception)
 
-    def __init__(self, fn, args, kwargs):
+
+class _Worker(QRunnable):
+    def __init__(self, fn, args, kwargs, signals):
         super().__init__()
+        self.setAutoDelete(False)
         self.fn = fn
         self.args = args
         self.kwargs = kwargs
+        self.signals = signals
 
     def run(self):
         try:
             result = self.fn(*self.args, **self.kwargs)
-            self.success.emit(result)
+            self.signals.success.emit(result)
 
         except Exception as e:
-            self.error.emit(e)
+            self.signals.error.emit(e)
+
+
+class _Subscriber:
+    """One run_async caller waiting on a task, with its own UI blocking."""
+
+    def __init__(self, parent_widget, block_cursor, on_success, on_error, on_finished):
+        self.parent_widget = parent_widget
+        self.block_cursor = block_cursor
+        self.on_success = on_success
+        self.on_error = on_error
+        self.on_finished = on_finished
+
+    def block(self):
+        self.parent_widget.setEnabled(False)
+        if self.block_cursor == True:
+            QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+
+    def release(self):
+        # the widget may have been torn down while the task ran
+        try:
+            self.parent_widget.setEnabled(True)
+        except RuntimeError:
+            pass
+
+        if self.block_cursor == True:
+            QApplication.restoreOverrideCursor()
+
+        if self.on_finished:
+            self.on_finished()
+
+
+class _Task:
+    def __init__(self, key, fn, args, kwargs):
+        self.key = key
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.subscribers = []
+        self.signals = _Signals()
+        self.worker = _Worker(fn, args, kwargs, self.signals)
+
+        self.signals.success.connect(self._on_success)
+        self.signals.error.connect(self._on_error)
+
+    def same_call(self, fn, args, kwargs):
+        try:
+            return self.fn == fn and self.args == args and self.kwargs == kwargs
+        except Exception:
+            return False
+
+    def cancel(self):
+        """Detach all callers; their results are dropped and their UI unblocked."""
+        subscribers, self.subscribers = self.subscribers, []
+        for sub in subscribers:
+            sub.release()
+
+        # not started yet, so just pull it from the queue
+        if _get_pool().tryTake(self.worker):
+            self._done()
+
+    def _on_success(self, result):
+        subscribers = self._done()
+        for sub in subscribers:
+            try:
+                if sub.on_success:
+                    sub.on_success(result)
+            finally:
+                sub.release()
+
+    def _on_error(self, e):
+        subscribers = self._done()
+        for sub in subscribers:
+            try:
+                if sub.on_error:
+                    sub.on_error(e)
+            finally:
+                sub.release()
+
+    def _done(self):
+        if self.key is not None and _keyed.get(self.key) is self:
+            del _keyed[self.key]
+        _running.discard(self)
+        subscribers, self.subscribers = self.subscribers, []
+        return subscribers
+
+
+def cancel_async(key):
+    """Drops the result of the task in flight for key, if any."""
+    task = _keyed.get(key)
+    if task is not None:
+        task.cancel()
 
-        finally:
-            self.finished.emit()
 
 def run_async(
     *,
@@ -40,9 +154,11 @@ def run_async(
     on_success=None,
     on_error=None,
     on_finished=None,
+    key=None,
+    priority=0,
 ):
     """
-    Runs a function asynchronously while blocking the given widget.
+    Runs a function on the shared worker pool while blocking the given widget.
 
     parent_widget: QWidget to block interaction on
     fn: callable to execute
@@ -50,44 +166,34 @@ def run_async(
     on_success(result): called in GUI thread
     on_error(exception): called in GUI thread
     on_finished(): always called in GUI thread
+    key: optional slot name. A call matching the one already in flight for
+        the key joins it instead of running twice; a different call
+        supersedes it, so the older result is never delivered.
+    priority: higher runs first when the pool is saturated
     """
 
     if kwargs is None:
         kwargs = {}
 
-    # block the parent ui
-    parent_widget.setEnabled(False)
-    if block_cursor == True:
-        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
-
-    thread = QThread(parent_widget)
-    worker = _Worker(fn, args, kwargs)
-    worker.moveToThread(thread)
-
-    # connect
-    thread.started.connect(worker.run)
-
-    if on_success:
-        worker.success.connect(on_success)
+    subscriber = _Subscriber(parent_widget, block_cursor, on_success, on_error, on_finished)
 
-    if on_error:
-        worker.error.connect(on_error)
+    task = _keyed.get(key) if key is not None else None
+    if task is not None and not task.same_call(fn, args, kwargs):
+        task.cancel()
+        task = None
 
-    def _cleanup():
-        parent_widget.setEnabled(True)
-
-        if block_cursor == True:
-            QApplication.restoreOverrideCursor()
-
-        if on_finished:
-            on_finished()
+    # block the parent ui
+    subscriber.block()
 
-        worker.deleteLater()
-        thread.quit()
-        thread.wait()
-        thread.deleteLater()
+    if task is not None:
+        task.subscribers.append(subscriber)
+        return
 
-    worker.finished.connect(_cleanup)
+    task = _Task(key, fn, args, kwargs)
+    task.subscribers.append(subscriber)
+    if key is not None:
+        _keyed[key] = task
+    _running.add(task)
 
     # start
-    thread.start()
\ No newline at end of file
+    _get_pool().start(task.worker, priority)
@@ -0,0 +1,94 @@
+import threading
+import time
+
+
+class DatasetCache:
+    """
+    Freshness bookkeeping for the datasets Session keeps in memory.
+
+    The data itself stays on Session's attributes; this only tracks, per key,
+    when it was last fetched, whether a refresh is in flight, and fetch
+    sequence numbers so a slow fetch can't overwrite newer data when it
+    lands: a result is dropped if the key was invalidated after the fetch
+    began, or if a fetch that began later has already been applied.
+
+    A dataset is in one of three states for a given TTL:
+        "fresh"   - fetched within the TTL, serve as is
+        "stale"   - fetched before, but older than the TTL; serve and
+                    revalidate in the background
+        "missing" - never fetched, failed, or explicitly invalidated; fetch
+                    before serving
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._fetched_at = {}
+        self._seq = 0
+        # key -> first sequence number still allowed to commit
+        self._generation = {}
+        # key -> sequence number of the last applied fetch
+        self._committed = {}
+        self._refreshing = set()
+
+    def state(self, key: str, ttl: float) -> str:
+        with self._lock:
+            fetched_at = self._fetched_at.get(key)
+        if fetched_at is None:
+            return "missing"
+        if time.monotonic() - fetched_at < ttl:
+            return "fresh"
+        return "stale"
+
+    def age(self, key: str):
+        """Seconds since the dataset was last fetched, or None."""
+        with self._lock:
+            fetched_at = self._fetched_at.get(key)
+        return None if fetched_at is None else time.monotonic() - fetched_at
+
+    def begin(self, key: str) -> int:
+        """Call before fetching; returns a token to hand back to commit()."""
+        with self._lock:
+            self._seq += 1
+            return self._seq
+
+    def commit(self, key: str, token: int, apply, fresh: bool = True) -> bool:
+        """
+        Applies a fetched result via apply() unless the dataset was
+        invalidated since begin() or a later fetch already landed. Marks it fetched if fresh is True.
+        Returns whether the result was applied. apply() runs on the calling
+        thread, so callers pick the thread that may touch the data.
+        """
+        with self._lock:
+            if token < self._generation.get(key, 0) or token <= self._committed.get(key, 0):
+                return False
+            apply()
+            self._committed[key] = token
+            if fresh:
+                self._fetched_at[key] = time.monotonic()
+            else:
+                self._fetched_at.pop(key, None)
+            return True
+
+    def try_start_refresh(self, key: str) -> bool:
+        """Claims the background refresh slot for key; False if one is running."""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, key: str):
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def mark_stale(self, key: str):
+        """Records data loaded from elsewhere (e.g. disk) as present but due a refresh."""
+        with self._lock:
+            self._fetched_at[key] = float("-inf")
+
+    def invalidate(self, *keys: str):
+        """Forces the next load of each key to refetch before serving."""
+        with self._lock:
+            for key in keys:
+                self._fetched_at.pop(key, None)
+                self._generation[key] = self._seq + 1
@@ -1,18 +1,43 @@
+import atexit
 import json
+import os
+import threading
 import time
 from pathlib import Path
 from typing import Optional
+from app.client.controllers.asset_pack import AssetPack
 from app.client.controllers.resource_path import ResourcePath
 
 class ImageCache:
     """
     Handles local disk caching of remote images with ETag-based invalidation.
     Falls back to baked-in assets, then placeholders.
+
+    The index is kept in memory and written behind: changes mark it dirty and
+    a single flush runs FLUSH_DELAY seconds later (or at exit), so a burst of
+    stores from the prefetch threads costs one index write.
+
+    Disk use is capped at max_bytes: each entry tracks its size and last
+    access, and the least recently used images are evicted once a store
+    pushes the total over budget. Reads update last access in memory and
+    only schedule an index write once the stored value is ACCESS_RESOLUTION
+    seconds old, so cache hits rarely cost a write.
     """
 
+    FLUSH_DELAY = 2.0
+    ACCESS_RESOLUTION = 3600
+    MAX_BYTES = 150 * 1024 * 1024
+
     _cache_dir: Path = None
     _index: dict = {}
     _index_path: Path = None
+    _max_bytes: int = MAX_BYTES
+    _total_bytes: int = 0
+
+    _lock = threading.RLock()
+    _dirty: bool = False
+    _flush_timer: threading.Timer = None
+    _atexit_registered: bool = False
 
     PLACEHOLDERS = {
         "events":  str(ResourcePath.IMAGES / "event_placeholder.png"),
@@ -24,12 +49,24 @@ class ImageCache:
         "players": ResourcePath.PLAYERS,
     }
 
+    # built by admin/build_player_pack.py, preferred over BAKED_DIRS if present
+    BAKED_PACKS = {
+        "players": ResourcePath.PLAYERS_PACK,
+    }
+
+    _baked: dict = {}
+
     @classmethod
-    def init(cls, cache_dir: Path):
+    def init(cls, cache_dir: Path, max_bytes: int = None):
         cls._cache_dir = cache_dir
         cls._index_path = cache_dir / "index.json"
+        cls._max_bytes = max_bytes or cls.MAX_BYTES
         cache_dir.mkdir(parents=True, exist_ok=True)
         cls._load_index()
+        cls._compact()
+        if not cls._atexit_registered:
+            atexit.register(cls.flush)
+            cls._atexit_registered = True
 
     @classmethod
     def _load_index(cls):
@@ -41,12 +78,105 @@ class ImageCache:
         else:
             cls._index = {}
 
+    @classmethod
+    def _compact(cls):
+        """
+        Reconciles the index with the cache directory on startup: deletes
+        files the index doesn't know about, drops entries whose file is gone,
+        upgrades old entries to carry size/access info, then trims to budget.
+        """
+        with cls._lock:
+            expected = {}
+            for index_key, entry in list(cls._index.items()):
+                image_type, _, key = index_key.partition(":")
+                path = cls._cache_path(image_type, key)
+                try:
+                    size = path.stat().st_size
+                except OSError:
+                    del cls._index[index_key]
+                    cls._dirty = True
+                    continue
+
+                if not isinstance(entry, dict):
+                    entry = {"etag": entry, "cached_at": 0}
+                    cls._index[index_key] = entry
+                    cls._dirty = True
+                if entry.get("size") != size:
+                    entry["size"] = size
+                    cls._dirty = True
+                entry.setdefault("accessed_at", entry.get("cached_at") or 0)
+                expected[path.name] = index_key
+
+            for path in cls._cache_dir.iterdir():
+                if path == cls._index_path or path.name in expected:
+                    continue
+                try:
+                    if path.is_file():
+                        path.unlink()
+                except OSError:
+                    pass
+
+            cls._total_bytes = sum(e["size"] for e in cls._index.values())
+            cls._evict()
+            if cls._dirty:
+                cls._save_index()
+
+    @classmethod
+    def _evict(cls, keep: str = None):
+        """Delete least recently used images until the cache fits the budget."""
+        if cls._total_bytes <= cls._max_bytes:
+            return
+
+        by_access = sorted(
+            cls._index.items(),
+            key=lambda item: item[1].get("accessed_at") or 0
+        )
+        for index_key, entry in by_access:
+            if cls._total_bytes <= cls._max_bytes:
+                break
+            if index_key == keep:
+                continue
+            image_type, _, key = index_key.partition(":")
+            try:
+                cls._cache_path(image_type, key).unlink()
+            except FileNotFoundError:
+                pass
+            except OSError:
+                continue
+            cls._total_bytes -= entry.get("size", 0)
+            del cls._index[index_key]
+            cls._dirty = True
+
     @classmethod
     def _save_index(cls):
-        try:
-            cls._index_path.write_text(json.dumps(cls._index, indent=2))
-        except Exception:
-            pass
+        """Mark the index dirty and schedule a coalesced flush."""
+        with cls._lock:
+            cls._dirty = True
+            if cls._flush_timer is not None:
+                return
+            cls._flush_timer = threading.Timer(cls.FLUSH_DELAY, cls.flush)
+            cls._flush_timer.daemon = True
+            cls._flush_timer.start()
+
+    @classmethod
+    def flush(cls):
+        """Write the index to disk now if it has unsaved changes."""
+        with cls._lock:
+            if cls._flush_timer is not None:
+                cls._flush_timer.cancel()
+                cls._flush_timer = None
+            if not cls._dirty or cls._index_path is None:
+                return
+            payload = json.dumps(cls._index, separators=(",", ":"))
+            cls._dirty = False
+
+            # write to a temp file then swap so a crash never leaves a torn index
+            tmp_path = cls._index_path.with_suffix(".json.tmp")
+            try:
+                tmp_path.write_text(payload)
+                os.replace(tmp_path, cls._index_path)
+            except Exception:
+                cls._dirty = True
 
     @classmethod
     def _cache_path(cls, image_type: str, key: str) -> Path:
@@ -60,10 +190,23 @@ class ImageCache:
     def store(cls, image_type: str, key: str, data: bytes, etag: str):
         """Store image bytes and ETag to disk cache."""
         path = cls._cache_path(image_type, key)
+        index_key = cls._index_key(image_type, key)
         try:
             path.write_bytes(data)
-            cls._index[cls._index_key(image_type, key)] = {"etag": etag, "cached_at": time.time()}
-            cls._save_index()
+            now = time.time()
+            with cls._lock:
+                previous = cls._index.get(index_key)
+                if isinstance(previous, dict):
+                    cls._total_bytes -= previous.get("size", 0)
+                cls._index[index_key] = {
+                    "etag": etag,
+                    "cached_at": now,
+                    "accessed_at": now,
+                    "size": len(data)
+                }
+                cls._total_bytes += len(data)
+                cls._evict(keep=index_key)
+                cls._save_index()
         except Exception:
             pass
 
@@ -71,12 +214,25 @@ class ImageCache:
     def get_cached(cls, image_type: str, key: str) -> Optional[bytes]:
         """Return cached bytes if they exist on disk, else None."""
         path = cls._cache_path(image_type, key)
-        if path.exists():
-            try:
-                return path.read_bytes()
-            except Exception:
-                return None
-        return None
+        try:
+            data = path.read_bytes()
+        except Exception:
+            return None
+
+        with cls._lock:
+            entry = cls._index.get(cls._index_key(image_type, key))
+            if isinstance(entry, dict):
+                now = time.time()
+                stale = now - (entry.get("accessed_at") or 0) >= cls.ACCESS_RESOLUTION
+                entry["accessed_at"] = now
+                if stale:
+                    cls._save_index()
+        return data
+
+    @classmethod
+    def has_cached(cls, image_type: str, key: str) -> bool:
+        """Return True if the image is on disk, without reading it."""
+        return cls._cache_path(image_type, key).exists()
 
     @classmethod
     def get_etag(cls, image_type: str, key: str) -> Optional[str]:
@@ -94,20 +250,71 @@ class ImageCache:
             return entry.get("cached_at")
         return None
 
+    @classmethod
+    def touch(cls, image_type: str, key: str):
+        """Mark a cached image as freshly revalidated without rewriting it."""
+        with cls._lock:
+            entry = cls._index.get(cls._index_key(image_type, key))
+            if not isinstance(entry, dict):
+                return
+            entry["cached_at"] = time.time()
+            cls._save_index()
+
+    @classmethod
+    def _baked_source(cls, image_type: str):
+        """
+        Returns the baked assets for a type, loaded once: the memory-mapped
+        pack if one was built, otherwise a {key: path} listing of the baked
+        directory. None if the type has no baked assets.
+        """
+        if image_type in cls._baked:
+            return cls._baked[image_type]
+
+        with cls._lock:
+            if image_type in cls._baked:
+                return cls._baked[image_type]
+
+            source = None
+            pack_path = cls.BAKED_PACKS.get(image_type)
+            if pack_path and pack_path.exists():
+                try:
+                    source = AssetPack(pack_path)
+                except Exception:
+                    source = None
+
+            baked_dir = cls.BAKED_DIRS.get(image_type)
+            if source is None and baked_dir and baked_dir.is_dir():
+                source = {}
+                # same priority as the old per-lookup probe order
+                for ext in (".webp", ".png", ".jpg"):
+                    for path in baked_dir.glob(f"*{ext}"):
+                        source[path.stem] = path
+
+            cls._baked[image_type] = source
+            return source
+
     @classmethod
     def get_baked(cls, image_type: str, key: str) -> Optional[bytes]:
         """Return bytes from baked-in assets if available."""
-        baked_dir = cls.BAKED_DIRS.get(image_type)
-        if not baked_dir:
+        source = cls._baked_source(image_type)
+        if not source:
+            return None
+        if isinstance(source, AssetPack):
+            view = source.get(key)
+            return bytes(view) if view is not None else None
+        path = source.get(key)
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except Exception:
             return None
-        for ext in (".jpg", ".png", ".webp"):
-            path = baked_dir / f"{key}{ext}"
-            if path.exists():
-                try:
-                    return path.read_bytes()
-                except Exception:
-                    return None
-        return None
+
+    @classmethod
+    def has_baked(cls, image_type: str, key: str) -> bool:
+        """Return True if a baked-in asset exists for the image."""
+        source = cls._baked_source(image_type)
+        return bool(source) and key in source
 
     @classmethod
     def get_placeholder(cls, image_type: str) -> Optional[bytes]:
@@ -126,6 +333,9 @@ class ImageCache:
         if path.exists():
             path.unlink()
         index_key = cls._index_key(image_type, key)
-        if index_key in cls._index:
-            del cls._index[index_key]
-            cls._save_index()
+        with cls._lock:
+            if index_key in cls._index:
+                entry = cls._index.pop(index_key)
+                if isinstance(entry, dict):
+                    cls._total_bytes -= entry.get("size", 0)
+                cls._save_index()
@@ -0,0 +1,65 @@
+import threading
+from collections import OrderedDict
+
+
+class PixmapCache:
+    """
+    Process-wide memory cache of decoded QPixmaps, keyed by
+    (image_type, key, size) where size is None for the full-size decode or
+    (width, height, aspect_mode) for a pre-scaled variant.
+
+    Entries are evicted least recently used first once the estimated pixel
+    memory passes MAX_BYTES. Pixmaps must only be built on the GUI thread, so
+    this is only meant to be used from there; the lock just keeps the
+    bookkeeping consistent.
+    """
+
+    MAX_BYTES = 96 * 1024 * 1024
+
+    _entries: OrderedDict = OrderedDict()
+    _total_bytes: int = 0
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _cost(pixmap) -> int:
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+    @classmethod
+    def get(cls, image_type: str, key: str, size=None):
+        """Return the cached pixmap and mark it recently used, or None."""
+        cache_key = (image_type, key, size)
+        with cls._lock:
+            pixmap = cls._entries.get(cache_key)
+            if pixmap is not None:
+                cls._entries.move_to_end(cache_key)
+            return pixmap
+
+    @classmethod
+    def put(cls, image_type: str, key: str, size, pixmap):
+        """Store a pixmap, evicting the oldest entries if over budget."""
+        cache_key = (image_type, key, size)
+        cost = cls._cost(pixmap)
+        with cls._lock:
+            previous = cls._entries.pop(cache_key, None)
+            if previous is not None:
+                cls._total_bytes -= cls._cost(previous)
+
+            cls._entries[cache_key] = pixmap
+            cls._total_bytes += cost
+
+            while cls._total_bytes > cls.MAX_BYTES and len(cls._entries) > 1:
+                _, evicted = cls._entries.popitem(last=False)
+                cls._total_bytes -= cls._cost(evicted)
+
+    @classmethod
+    def invalidate(cls, image_type: str, key: str):
+        """Drop every size variant of an image, e.g. after an avatar change."""
+        with cls._lock:
+            for cache_key in [k for k in cls._entries if k[0] == image_type and k[1] == key]:
+                cls._total_bytes -= cls._cost(cls._entries.pop(cache_key))
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._entries.clear()
+            cls._total_bytes = 0
@@ -1,5 +1,6 @@
 import asyncio
 import json
+import random
 from PyQt6.QtCore import QThread, pyqtSignal
 from websockets.asyncio.client import connect
 from app.db.supabase_client import SUPABASE_URL, SUPABASE_ANON_KEY
@@ -12,53 +13,245 @@ _WS_URL = (
     + f"/realtime/v1/websocket?apikey={SUPABASE_ANON_KEY}&vsn=1.0.0"
 )
 
+# phoenix drops sockets that stay quiet for ~60s
+HEARTBEAT_INTERVAL = 25
+
+# access tokens last an hour; push a fresh one to the channels well before
+TOKEN_REFRESH_INTERVAL = 600
+
+# reconnect delay doubles per failed attempt, up to the cap
+BACKOFF_BASE = 1
+BACKOFF_MAX = 30
+
 
 class RealtimeListener(QThread):
-    # Emits "history" or "chat" depending on which channel received a broadcast
-    ping = pyqtSignal(str)
+    # Emits "history", "chat", "draft" or "trades" with the rows received on
+    # that channel. A broadcast gives one row (none if its payload had no
+    # row), a catch-up after reconnecting gives everything missed while
+    # disconnected.
+    ping = pyqtSignal(str, list)
+
+    # True once the server has accepted every channel join, False whenever
+    # the socket drops or a join is rejected
+    connected = pyqtSignal(bool)
 
-    def __init__(self, access_token, refresh_token, league_id, parent=None):
+    def __init__(self, access_token, refresh_token, league_id, token_provider=None, gap_fill=None, parent=None):
+        """
+        token_provider(): returns a current access token, used on every
+        (re)join and periodically while connected
+        gap_fill(kind): returns "history" / "chat" rows newer than the last
+        seen one, called after a reconnect
+        Both are called off the GUI thread.
+        """
         super().__init__(parent)
         self._access_token  = access_token
         self._refresh_token = refresh_token
         self._league_id     = league_id
+        self._token_provider = token_provider
+        self._gap_fill      = gap_fill
         self._loop          = None
+        self._task          = None
+        self._stopping      = False
+        self._ref           = 0
+        self._pending_heartbeat = None
+        # join ref -> topic, for joins the server hasn't answered yet
+        self._pending_joins = {}
+        self._joined        = False
+
+        self._topics = {
+            f"realtime:league:{league_id}:{kind}": kind
+            for kind in ("history", "chat", "draft", "trades")
+        }
 
     def stop(self):
-        if self._loop and self._loop.is_running():
-            self._loop.call_soon_threadsafe(self._loop.stop)
+        self._stopping = True
+        try:
+            if self._loop and self._task and not self._loop.is_closed():
+                self._loop.call_soon_threadsafe(self._task.cancel)
+        except RuntimeError:
+            pass
         self.wait()
 
     def run(self):
         self._loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self._loop)
         try:
-            self._loop.run_until_complete(self._listen())
+            self._task = self._loop.create_task(self._listen())
+            self._loop.run_until_complete(self._task)
+        except asyncio.CancelledError:
+            pass
         except Exception as e:
             print(f"[RealtimeListener] error: {e}")
         finally:
             self._loop.close()
 
     async def _listen(self):
-        history_topic = f"realtime:league:{self._league_id}:history"
-        chat_topic    = f"realtime:league:{self._league_id}:chat"
-        topics        = {history_topic: "history", chat_topic: "chat"}
-
-        async with connect(_WS_URL) as ws:
-            # Join both channels
-            for ref, topic in enumerate(topics, start=1):
-                await ws.send(json.dumps({
-                    "topic": topic,
-                    "event": "phx_join",
-                    "payload": {
-                        "config": {"broadcast": {"ack": False}, "private": True},
-                        "access_token": self._access_token,
-                    },
-                    "ref": str(ref),
-                }))
+        attempt = 0
+        reconnecting = False
+
+        while not self._stopping:
+            try:
+                async with connect(_WS_URL) as ws:
+                    await self._join(ws)
+                    try:
+                        await self._receive(ws, catch_up=reconnecting)
+                    finally:
+                        self.connected.emit(False)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[RealtimeListener] connection lost: {e}")
+
+            # only a connection whose joins were accepted resets the backoff
+            if self._joined:
+                self._joined = False
+                reconnecting = True
+                attempt = 0
+
+            if self._stopping:
+                break
+
+            delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt)
+            attempt += 1
+            await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+
+    def _next_ref(self):
+        self._ref += 1
+        return str(self._ref)
+
+    async def _fresh_token(self):
+        if self._token_provider is not None:
+            try:
+                token = await asyncio.get_running_loop().run_in_executor(None, self._token_provider)
+                if token:
+                    self._access_token = token
+            except Exception as e:
+                print(f"[RealtimeListener] token refresh failed: {e}")
+        return self._access_token
+
+    async def _join(self, ws):
+        token = await self._fresh_token()
+        self._pending_heartbeat = None
+        self._pending_joins = {}
+        self._joined = False
+
+        for topic in self._topics:
+            ref = self._next_ref()
+            self._pending_joins[ref] = topic
+            await ws.send(json.dumps({
+                "topic": topic,
+                "event": "phx_join",
+                "payload": {
+                    "config": {"broadcast": {"ack": False}, "private": True},
+                    "access_token": token,
+                },
+                "ref": ref,
+            }))
 
+    async def _catch_up(self):
+        """Emits rows broadcast while the socket was down."""
+        if self._gap_fill is None:
+            return
+        loop = asyncio.get_running_loop()
+        for kind in ("history", "chat"):
+            try:
+                rows = await loop.run_in_executor(None, self._gap_fill, kind)
+            except Exception as e:
+                print(f"[RealtimeListener] catch up failed: {e}")
+                continue
+            if rows:
+                self.ping.emit(kind, list(rows))
+
+    async def _receive(self, ws, catch_up=False):
+        """
+        Reads the socket until it closes or a channel drops. Reports connected
+        once every join is acknowledged, then catches up on rows missed while
+        disconnected if catch_up is set. Returns on a rejected join.
+        """
+        keepalive = asyncio.create_task(self._keepalive(ws))
+        catching_up = None
+        try:
             async for raw in ws:
                 msg   = json.loads(raw)
                 topic = msg.get("topic")
-                if msg.get("event") == "broadcast" and topic in topics:
-                    self.ping.emit(topics[topic])
+                event = msg.get("event")
+
+                if topic == "phoenix" and event == "phx_reply":
+                    if msg.get("ref") == self._pending_heartbeat:
+                        self._pending_heartbeat = None
+                    continue
+
+                if topic not in self._topics:
+                    continue
+
+                if event == "phx_reply" and msg.get("ref") in self._pending_joins:
+                    status = (msg.get("payload") or {}).get("status")
+                    if status != "ok":
+                        print(f"[RealtimeListener] join rejected for {topic}: {msg.get('payload')}")
+                        return
+                    del self._pending_joins[msg["ref"]]
+                    if not self._pending_joins:
+                        self._joined = True
+                        self.connected.emit(True)
+                        if catch_up:
+                            catching_up = asyncio.create_task(self._catch_up())
+
+                elif event == "broadcast":
+                    record = self._extract_record(msg)
+                    self.ping.emit(self._topics[topic], [record] if record is not None else [])
+
+                # server dropped the channel (e.g. token expired), rejoin
+                # through a fresh connection
+                elif event in ("phx_error", "phx_close"):
+                    return
+        finally:
+            keepalive.cancel()
+            if catching_up is not None:
+                catching_up.cancel()
+
+    async def _keepalive(self, ws):
+        """Sends heartbeats, closes the socket if one goes unanswered, and
+        pushes a refreshed access token to the channels periodically."""
+        since_token = 0
+        while True:
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+
+            if self._pending_heartbeat is not None:
+                print("[RealtimeListener] heartbeat timed out")
+                await ws.close()
+                return
+
+            self._pending_heartbeat = self._next_ref()
+            await ws.send(json.dumps({
+                "topic": "phoenix",
+                "event": "heartbeat",
+                "payload": {},
+                "ref": self._pending_heartbeat,
+            }))
+
+            since_token += HEARTBEAT_INTERVAL
+            if since_token >= TOKEN_REFRESH_INTERVAL:
+                since_token = 0
+                token = await self._fresh_token()
+                for topic in self._topics:
+                    await ws.send(json.dumps({
+                        "topic": topic,
+                        "event": "access_token",
+                        "payload": {"access_token": token},
+                        "ref": self._next_ref(),
+                    }))
+
+    @staticmethod
+    def _extract_record(msg):
+        """
+        Pulls the row out of a broadcast. Database triggers send
+        {"payload": {"record": {...}, ...}}, realtime.send sends the row as
+        the payload itself.
+        """
+        payload = (msg.get("payload") or {}).get("payload")
+        if not isinstance(payload, dict):
+            return None
+        record = payload.get("record", payload)
+        if isinstance(record, dict) and ("id" in record or "created_at" in record):
+            return record
+        return None
@@ -15,4 +15,5 @@ class ResourcePath:
     IMAGES = resource_path.__func__("app/client/assets/images")
     TEXTS = resource_path.__func__("app/client/assets/texts")
     PLAYERS = resource_path.__func__("app/client/assets/players")
+    PLAYERS_PACK = resource_path.__func__("app/client/assets/players.pack")
     SOUNDS = resource_path.__func__("app/client/assets/sounds")
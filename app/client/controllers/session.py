@@ -1,7 +1,11 @@
+import threading
 import time
-from datetime import datetime, timedelta
+from bisect import bisect_left, insort
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from packaging import version
 
+from app.client.controllers.dataset_cache import DatasetCache
+from app.client.controllers.session_snapshot import SessionSnapshot
 from app.services.league_service import LeagueService
 from app.services.leaderboard_service import LeaderboardService
 from app.services.team_service import TeamService
@@ -13,18 +17,78 @@ class Session:
     """
     Local cache connecting the frontend to backend services.
     All state is stored as class attributes and refreshed on demand.
+
+    Freshness is tracked per dataset key in `datasets`. Each key has its own
+    TTL (see _ttl); once stale, the old data keeps being served while a
+    background refresh runs. Session.invalidate(*keys) after a mutation
+    forces the next load to refetch first.
     """
     VERSION = "1.5.0"
     SEASON = 13
     FORCE_COOLDOWN_SECONDS = 1
+    SYSTEM_STATE_TTL_SECONDS = 120
+    STATIC_TTL_SECONDS = 1800
+    # league polling fallback while realtime pushes are arriving
+    REALTIME_REFRESH_INTERVAL = 300
+    # league history / chat rows fetched per page
+    FEED_PAGE_SIZE = 100
+    # longest a worker waits for the GUI thread to apply a load
+    GUI_APPLY_TIMEOUT_SECONDS = 10
+    FEED_ATTRS = {"history": "league_history", "chat": "league_chat"}
+    # datasets made stale by a broadcast on each realtime topic
+    REALTIME_INVALIDATIONS = {
+        "history":  ("league",),
+        "chat":     (),
+        "draft":    ("league",),
+        "trades":   ("trades", "leaderboards", "league"),
+    }
+    IMAGE_MAX_AGE_SECONDS = 86400
+    PREFETCH_WORKERS = 8
+
+    # datasets persisted across launches (dataset key -> Session attribute);
+    # only global data that changes with admin score updates, nothing per user
+    SNAPSHOT_DATASETS = {
+        "players":      "player_scores",
+        "global_stats": "global_stats",
+        "events":       "event_data",
+    }
 
     _on_block: callable = None
+    # runs a callable on the GUI thread (set by the app); background
+    # refreshes apply their results through it
+    _dispatch: callable = None
+    _background = ThreadPoolExecutor(max_workers=2, thread_name_prefix="session-refresh")
+    _snapshot: SessionSnapshot = None
 
     @classmethod
     def _trigger_block(cls):
         if cls._on_block:
             cls._on_block()
 
+    @classmethod
+    def _on_gui(cls, fn, wait=False):
+        """
+        Runs fn on the GUI thread: inline when already there (or no app has
+        set _dispatch), otherwise queued. wait blocks the calling thread
+        until it has run, for callers that read the result straight after.
+        """
+        if cls._dispatch is None or threading.current_thread() is threading.main_thread():
+            fn()
+            return
+        if not wait:
+            cls._dispatch(fn)
+            return
+
+        done = threading.Event()
+        def _run():
+            try:
+                fn()
+            finally:
+                done.set()
+        cls._dispatch(_run)
+        # bounded so a worker can't hang once the event loop has stopped
+        done.wait(cls.GUI_APPLY_TIMEOUT_SECONDS)
+
     @classmethod
     def _set_defaults(cls):
         # authenticated supabase session
@@ -52,10 +116,13 @@ class Session:
         cls.player_scores           = None
         cls.global_stats            = None
         cls.event_data              = None
+        cls.event_scores            = None
         cls.qualified_data          = None
 
         cls.league_history          = None
         cls.league_chat             = None
+        cls.feed_league_id          = None
+        cls.feed_has_older          = {"history": False, "chat": False}
 
         cls.trade_windows           = None
         cls.trade_history           = None
@@ -69,11 +136,9 @@ class Session:
         cls.event_service           = None
         cls.trade_service           = None
 
-        # refresh timers
-        cls.league_data_grabbed_at      = None
-        cls.leaguemate_data_grabbed_at  = None
-        cls.trade_data_grabbed_at       = None
-        cls.system_state_grabbed_at     = None
+        # dataset freshness
+        cls.datasets                = DatasetCache()
+        cls.realtime_connected      = None
 
 Session._set_defaults()
 
@@ -100,18 +165,21 @@ class Session(Session):
 
     @classmethod
     def init_system_state(cls):
-        if cls.system_state_grabbed_at is not None:
-            if datetime.now() - cls.system_state_grabbed_at < timedelta(minutes=2):
-                return cls.blocking_state
+        if cls.datasets.state("system_state", cls.SYSTEM_STATE_TTL_SECONDS) == "fresh":
+            return cls.blocking_state
         try:
             system_state            = cls.auth_base.get_system_state()
-            cls.system_state_grabbed_at = datetime.now()
+            previous_updated_at     = cls.updated_at
             cls.blocking_state      = system_state["blocking"]
             cls.banner_message      = system_state["banner_message"]
             cls.warning_message     = system_state["warning_message"]
             cls.min_version         = system_state["version"]
             cls.updated_at          = system_state["updated_at"]
 
+            # admin score updates bump updated_at, everything score related is stale
+            if previous_updated_at is not None and previous_updated_at != cls.updated_at:
+                cls.invalidate("players", "global_stats", "events", "event_scores", "leaderboards", "league")
+
             client_version = version.parse(cls.VERSION.strip('"'))
             server_version = version.parse(cls.min_version.strip('"'))
 
@@ -122,6 +190,8 @@ class Session(Session):
                     f"({server_version}) at: "
                     f"https://fararjeh-fgc.com/fantasysf6"
                 )
+
+            cls.datasets.commit("system_state", cls.datasets.begin("system_state"), lambda: None)
             return cls.blocking_state
 
         except Exception as e:
@@ -131,104 +201,347 @@ class Session(Session):
 
     @classmethod
     def init_league_data(cls, force=False):
-        if cls.init_system_state():
-            cls._trigger_block()
-            return
-        if not cls._should_refresh(cls.league_data_grabbed_at, force=force):
-            return
+        def _fetch():
+            results = cls._gather(
+                league  = cls.league_service.get_full_league_info,
+                team    = cls.team_service.get_full_team_info,
+                history = lambda: cls._fetch_feed("history"),
+                chat    = lambda: cls._fetch_feed("chat"),
+            )
+            return results, results["league"] is not None
+
+        def _apply(results):
+            cls.league_data     = results["league"]
+            cls.team_data       = results["team"]
+
+            for kind, attr in cls.FEED_ATTRS.items():
+                if results[kind] is None:
+                    setattr(cls, attr, None)
+                    continue
+                league_id, rows, has_older = results[kind]
+                # keep rows pushed over realtime while the fetch was in flight
+                if league_id == cls.feed_league_id:
+                    rows, _ = cls._merge_rows(rows, getattr(cls, attr) or [])
+                setattr(cls, attr, rows)
+                cls.feed_has_older[kind] = has_older
+                cls.feed_league_id = league_id
+
+        cls._load("league", _fetch, _apply, force=force, has_data=cls.league_data is not None)
 
-        try:
-            cls.league_data             = cls.league_service.get_full_league_info()
-            cls.league_data_grabbed_at  = datetime.now()
-        except Exception:
-            cls.league_data             = None
-            cls.league_data_grabbed_at  = None
+    @classmethod
+    def init_leaderboards(cls, force=False):
+        cls._load(
+            "leaderboards",
+            cls._fetch_one(cls.leaderboard_service.get_leaguemate_standings),
+            lambda result: setattr(cls, "leaguemate_standings", result),
+            force=force,
+            has_data=cls.leaguemate_standings is not None
+        )
 
-        try:
-            cls.team_data = cls.team_service.get_full_team_info()
-        except Exception:
-            cls.team_data = None
-        
-        try:
-            cls.league_history = cls.league_service.get_league_history()
-            cls.league_chat    = cls.league_service.get_league_chat()
-        except Exception:
-            cls.league_history = None
-            cls.league_chat    = None
+    @classmethod
+    def init_player_scores(cls):
+        cls._load(
+            "players",
+            cls._fetch_one(cls.leaderboard_service.get_players),
+            lambda result: setattr(cls, "player_scores", result),
+            has_data=cls.player_scores is not None
+        )
 
     @classmethod
-    def init_leaderboards(cls, force=False):
-        if cls.init_system_state():
-            cls._trigger_block()
-            return
-        if not cls._should_refresh(cls.leaguemate_data_grabbed_at, force=force):
-            return
+    def init_global_stats(cls):
+        cls._load(
+            "global_stats",
+            cls._fetch_one(cls.leaderboard_service.get_global_stats),
+            lambda result: setattr(cls, "global_stats", result),
+            has_data=cls.global_stats is not None
+        )
 
-        try:
-            cls.leaguemate_standings        = cls.leaderboard_service.get_leaguemate_standings()
-            cls.leaguemate_data_grabbed_at  = datetime.now()
-        except Exception:
-            cls.leaguemate_standings        = None
-            cls.leaguemate_data_grabbed_at  = None
+    @classmethod
+    def init_event_data(cls):
+        cls._load(
+            "events",
+            cls._fetch_one(cls.event_service.get_events),
+            lambda result: setattr(cls, "event_data", result),
+            has_data=cls.event_data is not None
+        )
 
     @classmethod
-    def init_player_scores(cls):
-        if cls.init_system_state():
-            cls._trigger_block()
-            return
-        if cls.player_scores is not None:
+    def init_event_scores(cls):
+        """
+        Loads the league's season score matrix, which backs the "me" and
+        "league" tabs of every event.
+        """
+        league_id = cls.league_data.get("league_id") if cls.league_data else None
+        if league_id is None:
             return
 
-        try:
-            cls.player_scores = cls.leaderboard_service.get_players()
-        except Exception:
-            cls.player_scores = None
+        # matrix belongs to a league the user has since left
+        if cls.event_scores is not None and cls.event_scores["league_id"] != league_id:
+            cls.invalidate("event_scores")
+
+        cls._load(
+            "event_scores",
+            cls._fetch_one(lambda: cls.event_service.get_league_score_matrix(league_id)),
+            lambda result: setattr(cls, "event_scores", result),
+            has_data=cls.event_scores is not None
+        )
 
     @classmethod
-    def init_global_stats(cls):
-        if cls.init_system_state():
-            cls._trigger_block()
-            return
-        if cls.global_stats is not None:
-            return
+    def get_user_event_scores(cls, team_id, event_id):
+        cls.init_event_scores()
+        if cls.event_scores is None:
+            return cls.event_service.get_user_event_scores(team_id, event_id)
+        return cls.event_service.user_scores_from_matrix(cls.event_scores, team_id, event_id)
 
-        try:
-            cls.global_stats = cls.leaderboard_service.get_global_stats()
-        except Exception:
-            cls.global_stats = None
+    @classmethod
+    def get_league_event_scores(cls, league_id, event_id):
+        cls.init_event_scores()
+        if cls.event_scores is None or cls.event_scores["league_id"] != league_id:
+            return cls.event_service.get_league_event_scores(league_id, event_id)
+        return cls.event_service.league_scores_from_matrix(cls.event_scores, event_id)
 
     @classmethod
-    def init_event_data(cls):
-        if cls.init_system_state():
-            cls._trigger_block()
+    def init_trade_data(cls, force=False):
+        def _fetch():
+            results = cls._gather(
+                windows  = cls.trade_service.get_trade_windows,
+                history  = cls.trade_service.get_trade_history,
+                requests = lambda: cls.trade_service.get_open_requests(cls.user_id),
+                players  = cls.trade_service.get_pool_players,
+            )
+            return results, all(r is not None for r in results.values())
+
+        def _apply(results):
+            cls.trade_windows   = results["windows"]
+            cls.trade_history   = results["history"]
+            cls.trade_requests  = results["requests"]
+            cls.trade_players   = results["players"]
+
+        cls._load("trades", _fetch, _apply, force=force, has_data=cls.trade_windows is not None)
+
+    @staticmethod
+    def _merge_rows(current, rows):
+        """
+        Merges rows into a created_at-sorted list, skipping any already held
+        (same id, or same created_at if there's no id). Returns the merged
+        list and the rows that were new.
+        """
+        def _row_key(row):
+            return ("id", row["id"]) if row.get("id") is not None else ("created_at", row.get("created_at"))
+
+        merged = list(current)
+        seen = {_row_key(row) for row in merged}
+        added = []
+        for row in rows:
+            row_key = _row_key(row)
+            if row_key in seen:
+                continue
+            seen.add(row_key)
+            insort(merged, row, key=lambda r: r.get("created_at") or "")
+            added.append(row)
+        return merged, added
+
+    @classmethod
+    def _feed_loader(cls, kind):
+        return {
+            "history": cls.league_service.get_league_history,
+            "chat": cls.league_service.get_league_chat,
+        }[kind]
+
+    @staticmethod
+    def _cursor(rows, newest=True):
+        """
+        (created_at, id) keyset cursor at the newest (or oldest) end of a
+        created_at-sorted history / chat list. Realtime rows can lack an id,
+        so it's taken from the nearest row that has one; with none at all the
+        id is None and the query falls back to created_at alone.
+        """
+        for row in (reversed(rows) if newest else rows):
+            if row.get("id") is not None:
+                return row.get("created_at"), row["id"]
+        edge = rows[-1] if newest else rows[0]
+        return edge.get("created_at"), None
+
+    @classmethod
+    def _fetch_feed(cls, kind):
+        """
+        League history or chat for init_league_data. With rows for the same
+        league already held, only fetches rows from the newest one onwards;
+        otherwise just the latest page. Returns (league_id, rows, has_older).
+        """
+        league_id = cls.league_service.get_my_league()
+        current = getattr(cls, cls.FEED_ATTRS[kind]) or []
+        loader = cls._feed_loader(kind)
+
+        if current and league_id == cls.feed_league_id:
+            newer = loader(since=cls._cursor(current)) or []
+            rows, _ = cls._merge_rows(current, newer)
+            return league_id, rows, cls.feed_has_older[kind]
+
+        rows = loader(limit=cls.FEED_PAGE_SIZE) or []
+        return league_id, rows, len(rows) >= cls.FEED_PAGE_SIZE
+
+    @classmethod
+    def feed_horizon(cls):
+        """
+        created_at below which the merged history + chat feed isn't complete:
+        the newest of the oldest rows held among the kinds with older pages
+        left. None once both are fully loaded.
+        """
+        oldest = [
+            rows[0].get("created_at") or ""
+            for kind, attr in cls.FEED_ATTRS.items()
+            if cls.feed_has_older[kind] and (rows := getattr(cls, attr))
+        ]
+        return max(oldest) if oldest else None
+
+    @classmethod
+    def feed_window(cls, rows: list[dict]) -> list[dict]:
+        """
+        The part of a created_at-sorted history / chat list at or after
+        feed_horizon(), so one stream isn't shown further back than the other.
+        """
+        horizon = cls.feed_horizon()
+        if horizon is None or not rows:
+            return rows or []
+        return rows[bisect_left(rows, horizon, key=lambda r: r.get("created_at") or ""):]
+
+    @classmethod
+    def fetch_older_feed(cls) -> dict:
+        """
+        Fetches the page before the oldest held row for whichever kinds sit
+        at feed_horizon(), the ones holding the merged feed back. Doesn't
+        merge them; pass the result to apply_older_feed on the GUI thread.
+        """
+        horizon = cls.feed_horizon()
+        pages = {}
+        for kind, attr in cls.FEED_ATTRS.items():
+            rows = getattr(cls, attr) or []
+            if not rows or not cls.feed_has_older[kind]:
+                continue
+            if (rows[0].get("created_at") or "") != horizon:
+                continue
+            pages[kind] = cls._feed_loader(kind)(
+                before=cls._cursor(rows, newest=False),
+                limit=cls.FEED_PAGE_SIZE
+            ) or []
+        return pages
+
+    @classmethod
+    def apply_older_feed(cls, pages: dict):
+        for kind, older in pages.items():
+            cls.feed_has_older[kind] = len(older) >= cls.FEED_PAGE_SIZE
+            cls.apply_league_rows(kind, older)
+
+    @classmethod
+    def apply_league_rows(cls, kind: str, rows: list[dict]) -> list[dict]:
+        """
+        Merges rows pushed over realtime (or paged in) into league_history
+        ("history") or league_chat ("chat") in created_at order, without
+        refetching. Returns the rows that were new.
+        """
+        attr = cls.FEED_ATTRS[kind]
+        merged, added = cls._merge_rows(getattr(cls, attr) or [], rows)
+        if added:
+            setattr(cls, attr, merged)
+        return added
+
+    @classmethod
+    def fetch_league_rows_since(cls, kind: str) -> list[dict]:
+        """
+        Rows of league_history ("history") or league_chat ("chat") from the
+        newest one held onwards, for catching up after a realtime reconnect.
+        Doesn't merge them; pass them to apply_league_rows.
+        """
+        rows = getattr(cls, cls.FEED_ATTRS[kind]) or []
+        if not rows:
+            return cls._feed_loader(kind)(limit=cls.FEED_PAGE_SIZE) or []
+        return cls._feed_loader(kind)(since=cls._cursor(rows)) or []
+
+    @classmethod
+    def invalidate(cls, *keys):
+        """
+        Marks datasets as out of date after a mutation, so their next load
+        refetches instead of serving what's in memory. Keys: "league",
+        "leaderboards", "trades", "players", "global_stats", "events",
+        "event_scores".
+        """
+        # rosters only change through league and trade mutations
+        if "league" in keys or "trades" in keys:
+            keys = (*keys, "event_scores")
+            if cls.event_service:
+                cls.event_service.invalidate_roster_index()
+
+        # player timelines are score history, which only moves with updated_at
+        if "players" in keys and cls.event_service:
+            cls.event_service.invalidate_timelines()
+
+        cls.datasets.invalidate(*keys)
+
+    # ------------------------------------------------------------------
+    # Snapshot
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def init_snapshot(cls, path):
+        """Points Session at its on-disk snapshot and hydrates from it."""
+        cls._snapshot = SessionSnapshot(path)
+        cls.load_snapshot()
+
+    @classmethod
+    def load_snapshot(cls):
+        """
+        Fills the snapshot datasets from disk and marks them stale, so the
+        first view renders straight away and a background refresh follows.
+        The stored updated_at lets init_system_state drop them outright if an
+        admin score update has happened since.
+        """
+        if cls._snapshot is None:
             return
-        if cls.event_data is not None:
+        snapshot = cls._snapshot.load(cls.VERSION, cls.SEASON)
+        if snapshot is None:
             return
 
-        try:
-            cls.event_data = cls.event_service.get_events()
-        except Exception:
-            cls.event_data = None
+        from app.client.controllers.image_cache import ImageCache
+
+        datasets = snapshot["datasets"]
+        for key, attr in cls.SNAPSHOT_DATASETS.items():
+            data = datasets.get(key)
+            if data is None:
+                continue
+
+            # event images live in the image cache, not the snapshot
+            if key == "events":
+                for event in data:
+                    image_name = event.get("image")
+                    if isinstance(image_name, str) and image_name.endswith(".webp"):
+                        event["image_bytes"] = ImageCache.get_cached("events", image_name[:-5])
+                    else:
+                        event["image_bytes"] = None
+
+            setattr(cls, attr, data)
+            cls.datasets.mark_stale(key)
+
+        cls.updated_at = snapshot["updated_at"]
 
     @classmethod
-    def init_trade_data(cls, force=False):
-        if cls.init_system_state():
-            cls._trigger_block()
+    def save_snapshot(cls):
+        """Writes the snapshot datasets currently in memory to disk."""
+        if cls._snapshot is None:
             return
-        if not cls._should_refresh(cls.trade_data_grabbed_at, force=force):
-            return
-        
-        try:
-            cls.trade_windows = cls.trade_service.get_trade_windows()
-            cls.trade_history = cls.trade_service.get_trade_history()
-            cls.trade_requests = cls.trade_service.get_open_requests(cls.user_id)
-            cls.trade_players = cls.trade_service.get_pool_players()
 
-        except Exception:
-            cls.trade_windows = None
-            cls.trade_history = None
-            cls.trade_requests = None
-            cls.trade_players = None
+        datasets = {}
+        for key, attr in cls.SNAPSHOT_DATASETS.items():
+            data = getattr(cls, attr)
+            # skip datasets invalidated since they were fetched
+            if data is None or cls.datasets.age(key) is None:
+                continue
+            if key == "events":
+                data = [{k: v for k, v in event.items() if k != "image_bytes"} for event in data]
+            datasets[key] = data
+
+        if datasets:
+            cls._snapshot.save(cls.VERSION, cls.SEASON, cls.updated_at, datasets)
 
     # ------------------------------------------------------------------
     # Images
@@ -239,12 +552,19 @@ class Session(Session):
         """
         Full image pipeline:
         1. Check baked-in assets (players only)
-        2. Check local disk cache + validate ETag
-        3. Fetch from API if stale or missing
+        2. Check local disk cache, serve it if revalidated within a day
+        3. Conditional GET with the cached ETag (304 keeps the cached copy)
         4. Fall back to placeholder
         """
         from app.client.controllers.image_cache import ImageCache
 
+        return cls._resolve_image(image_type, key) or ImageCache.get_placeholder(image_type) or b""
+
+    @classmethod
+    def _resolve_image(cls, image_type: str, key: str) -> bytes | None:
+        """Steps 1-3 of get_image; None when the image couldn't be had."""
+        from app.client.controllers.image_cache import ImageCache
+
         # 1. baked-in
         baked = ImageCache.get_baked(image_type, key)
         if baked:
@@ -252,26 +572,23 @@ class Session(Session):
 
         # 2. disk cache
         cached = ImageCache.get_cached(image_type, key)
-        cached_etag = ImageCache.get_etag(image_type, key)
+        cached_etag = ImageCache.get_etag(image_type, key) if cached else None
 
         if cached and cached_etag:
             cached_at = ImageCache.get_cached_at(image_type, key)
-            if cached_at and (time.time() - cached_at) < 86400:
-                return cached
-            filename = cls._image_filename(image_type, key)
-            remote_etag = cls.auth_base.get_image_etag(image_type, filename)
-            if remote_etag == cached_etag:
+            if cached_at and (time.time() - cached_at) < cls.IMAGE_MAX_AGE_SECONDS:
                 return cached
 
-        # 3. fetch from API
+        # 3. fetch from API, conditional on the cached etag if we have one
         filename = cls._image_filename(image_type, key)
-        data, etag = cls.auth_base.get_image(image_type, filename)
+        data, etag = cls.auth_base.get_image(image_type, filename, etag=cached_etag)
         if data:
             ImageCache.store(image_type, key, data, etag or "")
             return data
-
-        # 4. placeholder
-        return ImageCache.get_placeholder(image_type) or b""
+        if cached and cached_etag and etag == cached_etag:
+            ImageCache.touch(image_type, key)
+            return cached
+        return None
 
     @classmethod
     def _image_filename(cls, image_type: str, key: str) -> str:
@@ -280,23 +597,136 @@ class Session(Session):
         filename = key.replace(" ", "_") + ".webp"
         return filename
 
+    @classmethod
+    def prefetch_images(cls, items, on_progress=None, max_workers=None) -> int:
+        """
+        Warms the image caches for a batch of (image_type, key) pairs before
+        a view renders them. Baked, in-memory and freshly cached images are
+        resolved up front; only the rest go to the network, fetched
+        concurrently on a bounded pool through get_image/init_avatar.
+
+        on_progress(done, total) is called from the calling thread as each
+        image resolves. Returns the number of images that needed fetching.
+        """
+        from app.client.controllers.image_cache import ImageCache
+
+        # dedupe while keeping order
+        pending = list(dict.fromkeys((t, str(k)) for t, k in items if k))
+        total = len(pending)
+        done = 0
+
+        misses = []
+        now = time.time()
+        for image_type, key in pending:
+            if image_type == "avatars" and key in cls.avatar_cache:
+                resolved = True
+            elif ImageCache.has_baked(image_type, key):
+                resolved = True
+            else:
+                cached_at = ImageCache.get_cached_at(image_type, key)
+                resolved = (
+                    ImageCache.get_etag(image_type, key)
+                    and cached_at
+                    and now - cached_at < cls.IMAGE_MAX_AGE_SECONDS
+                    and ImageCache.has_cached(image_type, key)
+                )
+                # avatars also live in memory, so a fresh disk hit is loaded there
+                if resolved and image_type == "avatars":
+                    resolved = False
+
+            if resolved:
+                done += 1
+                if on_progress:
+                    on_progress(done, total)
+            else:
+                misses.append((image_type, key))
+
+        if not misses:
+            return 0
+
+        def _fetch(image_type, key):
+            if image_type == "avatars":
+                return cls.init_avatar(key)
+            return cls.get_image(image_type, key)
+
+        workers = min(max_workers or cls.PREFETCH_WORKERS, len(misses))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_fetch, t, k) for t, k in misses]
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception:
+                    pass
+                done += 1
+                if on_progress:
+                    on_progress(done, total)
+
+        return len(misses)
+
     @classmethod
     def init_avatar(cls, user_id: str) -> bytes:
         """Memory-cached wrapper for avatars since they're accessed repeatedly."""
         user_id = str(user_id)
         if user_id in cls.avatar_cache:
             return cls.avatar_cache[user_id]
-        result = cls.get_image("avatars", user_id)
+        result = cls._resolve_image("avatars", user_id)
+        if not result:
+            # don't pin the placeholder, retry on the next call
+            from app.client.controllers.image_cache import ImageCache
+            return ImageCache.get_placeholder("avatars") or b""
         cls.avatar_cache[user_id] = result
         return result
 
     @classmethod
-    def get_pixmap(cls, image_type: str, key: str):
+    def get_pixmap(cls, image_type: str, key: str, size: tuple[int, int] = None, aspect=None):
+        """
+        Returns a decoded QPixmap for an image, memory-cached per
+        (type, key, size). When size is given the pixmap is smooth-scaled to
+        (width, height) with the given aspect mode (ignore by default) and
+        that scaled variant is cached too. GUI thread only.
+        """
+        from PyQt6.QtCore import Qt
         from PyQt6.QtGui import QPixmap
-        pixmap = QPixmap()
-        data = cls.init_avatar(key) if image_type == "avatars" else cls.get_image(image_type, key)
-        if data:
-            pixmap.loadFromData(data)
+        from app.client.controllers.pixmap_cache import PixmapCache
+
+        if aspect is None:
+            aspect = Qt.AspectRatioMode.IgnoreAspectRatio
+        variant = (size[0], size[1], aspect.value) if size else None
+
+        pixmap = PixmapCache.get(image_type, key, variant)
+        if pixmap is not None:
+            return pixmap
+
+        if variant is None:
+            from app.client.controllers.image_cache import ImageCache
+
+            if image_type == "avatars":
+                data = cls.avatar_cache.get(str(key)) or cls._resolve_image(image_type, key)
+                if data:
+                    cls.avatar_cache[str(key)] = data
+            else:
+                data = cls._resolve_image(image_type, key)
+
+            pixmap = QPixmap()
+            if data and pixmap.loadFromData(data):
+                PixmapCache.put(image_type, key, None, pixmap)
+                return pixmap
+
+            # placeholder isn't cached under the image's key so it's retried
+            pixmap = QPixmap()
+            placeholder = ImageCache.get_placeholder(image_type)
+            if placeholder:
+                pixmap.loadFromData(placeholder)
+            return pixmap
+
+        pixmap = cls.get_pixmap(image_type, key).scaled(
+            size[0], size[1],
+            aspect,
+            Qt.TransformationMode.SmoothTransformation
+        )
+        # only cache the scaled variant of a real image
+        if PixmapCache.get(image_type, key, None) is not None:
+            PixmapCache.put(image_type, key, variant, pixmap)
         return pixmap
 
 
@@ -305,19 +735,127 @@ class Session(Session):
     # ------------------------------------------------------------------
 
     @classmethod
-    def _should_refresh(cls, grabbed_at, force=False):
+    def _gather(cls, **loaders) -> dict:
+        """
+        Runs independent loaders concurrently and returns {name: result}.
+        A loader that raises yields None without affecting the others.
+        """
+        # the loaders all start with identity lookups; resolve them once
+        # up front so the threads don't each miss the cache
+        try:
+            cls.auth_base.get_my_league()
+            cls.auth_base.get_my_team()
+        except Exception:
+            pass
+
+        def _run(loader):
+            try:
+                return loader()
+            except Exception:
+                return None
+
+        with ThreadPoolExecutor(max_workers=len(loaders)) as pool:
+            futures = {name: pool.submit(_run, loader) for name, loader in loaders.items()}
+            return {name: future.result() for name, future in futures.items()}
+
+    @classmethod
+    def _load(cls, key, fetch, apply, force=False, has_data=True):
+        """
+        Shared loader for every dataset. fetch() returns (result, ok) and runs
+        off the caller's lock; apply(result) stores it on Session.
+
+        - force: refetch now unless fetched within FORCE_COOLDOWN_SECONDS
+        - fresh: nothing to do
+        - stale with data in memory: serve it, refresh in the background
+        - missing (or no data yet): fetch before returning
+        """
+        if cls.init_system_state():
+            cls._trigger_block()
+            return
+
+        datasets = cls.datasets
+        state = datasets.state(key, cls._ttl(key))
+
         if force:
-            if grabbed_at is None:
-                return True
-            return grabbed_at <= datetime.now() - timedelta(seconds=cls.FORCE_COOLDOWN_SECONDS)
-        if grabbed_at is None:
-            return True
-        seconds = cls.get_refresh_interval()
-        return grabbed_at <= datetime.now() - timedelta(seconds=seconds)
+            age = datasets.age(key)
+            if age is not None and age < cls.FORCE_COOLDOWN_SECONDS:
+                return
+        elif state == "fresh":
+            return
+        elif state == "stale" and has_data:
+            if datasets.try_start_refresh(key):
+                cls._background.submit(cls._revalidate, datasets, key, fetch, apply)
+            return
+
+        token = datasets.begin(key)
+        result, ok = fetch()
+        # applied on the GUI thread like _revalidate, but waited on since the
+        # caller reads the data once _load returns
+        cls._on_gui(
+            lambda: datasets.commit(key, token, lambda: apply(result), fresh=ok),
+            wait=True
+        )
+
+    @classmethod
+    def _revalidate(cls, datasets, key, fetch, apply):
+        try:
+            token = datasets.begin(key)
+            result, ok = fetch()
+            if not ok:
+                # keep serving the stale copy
+                return
+
+            # apply on the GUI thread so it can't interleave with realtime
+            # merges or be read half done; drop results that land after a
+            # logout swapped the cache out
+            def _commit():
+                if datasets is cls.datasets:
+                    datasets.commit(key, token, lambda: apply(result))
+            cls._on_gui(_commit)
+        finally:
+            datasets.end_refresh(key)
+
+    @staticmethod
+    def _fetch_one(loader):
+        """Wraps a single service call as a _load fetch, None on failure."""
+        def _fetch():
+            try:
+                return loader(), True
+            except Exception:
+                return None, False
+        return _fetch
+
+    @classmethod
+    def _ttl(cls, key) -> float:
+        if key in ("league", "leaderboards", "trades"):
+            return cls.get_refresh_interval()
+        return cls.STATIC_TTL_SECONDS
+
+    @classmethod
+    def set_realtime_connected(cls, connected: bool):
+        """
+        Tracks whether league changes are being pushed. Broadcasts may have
+        been missed while disconnected, so a reconnect invalidates the
+        league datasets.
+        """
+        if connected and cls.realtime_connected is False:
+            cls.invalidate("league", "trades", "leaderboards")
+        cls.realtime_connected = connected
+
+    @classmethod
+    def apply_realtime(cls, kind: str, rows: list[dict]):
+        """Applies a realtime broadcast: merges history rows and invalidates what it touched."""
+        if kind == "history" and rows:
+            cls.apply_league_rows("history", rows)
+        keys = cls.REALTIME_INVALIDATIONS.get(kind, ())
+        if keys:
+            cls.invalidate(*keys)
 
     @classmethod
     def get_refresh_interval(cls) -> int:
         league = cls.league_data or {}
+        if cls.realtime_connected and league.get("league_id"):
+            return cls.REALTIME_REFRESH_INTERVAL
         if league.get("locked") and not league.get("draft_complete"):
             return 10
         elif league.get("league_id"):
@@ -327,4 +865,7 @@ class Session(Session):
 
     @classmethod
     def reset(cls):
+        # the snapshot datasets aren't tied to the account, keep them warm
+        cls.save_snapshot()
         cls._set_defaults()
+        cls.load_snapshot()
@@ -0,0 +1,68 @@
+import json
+import os
+import zlib
+from pathlib import Path
+from typing import Optional
+
+
+class SessionSnapshot:
+    """
+    Compressed JSON snapshot of Session datasets on disk, so a launch can
+    render from the last known data instead of waiting on the network.
+
+    Every snapshot carries stamps (client version, season, and the
+    system_state.updated_at it was fetched under). load() discards a
+    snapshot whose version or season doesn't match the running client;
+    updated_at is handed back so Session can compare it with the server.
+    """
+
+    FORMAT = 1
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def load(self, version: str, season: int) -> Optional[dict]:
+        """Returns {"updated_at": ..., "datasets": {...}} or None."""
+        try:
+            payload = json.loads(zlib.decompress(self.path.read_bytes()))
+        except Exception:
+            return None
+
+        if (
+            payload.get("format") != self.FORMAT
+            or payload.get("version") != version
+            or payload.get("season") != season
+        ):
+            return None
+
+        return {
+            "updated_at": payload.get("updated_at"),
+            "datasets": payload.get("datasets") or {},
+        }
+
+    def save(self, version: str, season: int, updated_at, datasets: dict) -> bool:
+        """Atomically replaces the snapshot; returns False if it couldn't be written."""
+        payload = {
+            "format": self.FORMAT,
+            "version": version,
+            "season": season,
+            "updated_at": updated_at,
+            "datasets": datasets,
+        }
+        try:
+            data = zlib.compress(
+                json.dumps(payload, separators=(",", ":")).encode("utf-8")
+            )
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, self.path)
+            return True
+        except Exception:
+            return False
+
+    def clear(self):
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
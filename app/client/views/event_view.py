@@ -936,8 +936,8 @@ class EventView(QWidget):
 
         tab_config = {
             "all":    (Session.event_service.get_event_standings,       (event_id,)),
-            "me":     (Session.event_service.get_user_event_scores,     (team_id,   event_id)),
-            "league": (Session.event_service.get_league_event_scores,   (league_id, event_id)),
+            "me":     (Session.get_user_event_scores,                   (team_id,   event_id)),
+            "league": (Session.get_league_event_scores,                 (league_id, event_id)),
         }
         builder_config = {
             "all":    self.create_all_score_data,
@@ -975,6 +975,8 @@ class EventView(QWidget):
             block_cursor=False,
             on_success=_success,
             on_error=_error,
+            key=("event_scores", event_id, tab),
+            priority=1,
         )
 
 
@@ -1173,12 +1175,11 @@ class EventView(QWidget):
 
     def _build_event_image(self, event, size=300):
         image = QLabel()
-        pixmap = Session.get_pixmap("events", event.get("name", ""))
         image.setPixmap(
-            pixmap.scaled(
-                size, size,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
+            Session.get_pixmap(
+                "events", event.get("name", ""),
+                size=(size, size),
+                aspect=Qt.AspectRatioMode.KeepAspectRatio
             )
         )
         return image
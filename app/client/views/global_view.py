@@ -192,11 +192,10 @@ class GlobalView(QWidget):
         user.setSpacing(15)
         user.setAlignment(Qt.AlignmentFlag.AlignHCenter)
 
-        pixmap = Session.get_pixmap("avatars", str(best_team["user_id"]))
         avatar = QLabel()
         avatar.setFixedSize(200, 200)
         avatar.setStyleSheet("border: 3px solid #FFFFFF; border-radius: 5px;")
-        avatar.setPixmap(pixmap.scaled(200, 200, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation))
+        avatar.setPixmap(Session.get_pixmap("avatars", str(best_team["user_id"]), size=(200, 200)))
 
         info_cont = QWidget()
         info_cont.setFixedWidth(300)
@@ -432,12 +431,13 @@ class GlobalView(QWidget):
         if not stats:
             return
         
+        images = []
         best_team = stats[0].get("best_scoring_team", {})
-        if best_team:
-            user_id = best_team.get("user_id")
-            if user_id:
-                Session.init_avatar(str(user_id))
+        if best_team and best_team.get("user_id"):
+            images.append(("avatars", str(best_team["user_id"])))
 
         for key in ("most_picked_players", "least_picked_players"):
             for player in stats[0].get(key, []):
-                Session.get_image("players", player["player_name"])
+                images.append(("players", player["player_name"]))
+
+        Session.prefetch_images(images)
@@ -15,6 +15,7 @@ from PyQt6.QtWidgets import (
 )
 
 from app.client.controllers.image_cache import ImageCache
+from app.client.controllers.pixmap_cache import PixmapCache
 from app.client.controllers.resource_path import ResourcePath
 from app.client.controllers.session import Session
 from app.client.controllers.sound_manager import SoundManager
@@ -166,6 +167,7 @@ class HomeView(QWidget):
             Session.auth_base.assign_avatar(file_path)
             Session.avatar_cache.pop(self.my_user_id, None)
             ImageCache.invalidate("avatars", str(self.my_user_id))
+            PixmapCache.invalidate("avatars", str(self.my_user_id))
             self._refresh_avatar()
             QApplication.restoreOverrideCursor()
 
@@ -193,21 +195,13 @@ class HomeView(QWidget):
     def _build_avatar(self):
         image = QLabel()
         image.setPixmap(
-            Session.get_pixmap("avatars", self.my_user_id).scaled(
-                250, 250,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
+            Session.get_pixmap("avatars", self.my_user_id, size=(250, 250), aspect=Qt.AspectRatioMode.KeepAspectRatio)
         )
         return image
 
     def _refresh_avatar(self):
         self.avatar_label.setPixmap(
-            Session.get_pixmap("avatars", self.my_user_id).scaled(
-                250, 250,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
+            Session.get_pixmap("avatars", self.my_user_id, size=(250, 250), aspect=Qt.AspectRatioMode.KeepAspectRatio)
         )
 
     def _view_help(self):
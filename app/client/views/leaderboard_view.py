@@ -297,11 +297,7 @@ class LeaderboardView(QWidget):
     def _build_avatar(self, user_id, size):
         image = QLabel()
         image.setPixmap(
-            Session.get_pixmap("avatars", str(user_id)).scaled(
-                size, size,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
+            Session.get_pixmap("avatars", str(user_id), size=(size, size), aspect=Qt.AspectRatioMode.KeepAspectRatio)
         )
         return image
 
@@ -362,9 +358,14 @@ class LeaderboardView(QWidget):
 
 # -- LAYOUT STUFF --
 
-    def _refresh(self, force=0):
+    @staticmethod
+    def fetch(force=0):
         Session.init_leaderboards(force)
 
+    def _refresh(self, force=0, fetch=True):
+        if fetch:
+            self.fetch(force)
+
         self.my_username = Session.user
         self.my_user_id = Session.user_id
         self.leaguemate_data = Session.leaguemate_standings
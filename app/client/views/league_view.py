@@ -25,10 +25,11 @@ from PyQt6.QtWidgets import (
 
 from app.client.controllers.resource_path import ResourcePath
 from app.client.controllers.session import Session
-from app.client.controllers.async_runner import run_async
+from app.client.controllers.async_runner import cancel_async, run_async
 from app.client.controllers.sound_manager import SoundManager
 from app.client.controllers.realtime_listener import RealtimeListener
 from app.client.widgets.misc import fit_text_to_width, set_status
+from app.client.widgets.feed_list import FeedList
 from app.client.widgets.hover_image import HoverImage
 from app.client.widgets.point_graph import PointsChart
 from app.client.theme import *
@@ -461,14 +462,11 @@ class LeagueView(QWidget):
         scroll.setFrameShape(QFrame.Shape.NoFrame)
         scroll.setStyleSheet(SCROLL_STYLESHEET)
 
-        # Inner container — rows appended by _update_history_feed
-        self._history_feed_container = QWidget()
-        self._history_feed_layout = QVBoxLayout(self._history_feed_container)
-        self._history_feed_layout.setContentsMargins(0, 4, 0, 4)
-        self._history_feed_layout.setSpacing(0)
-        self._history_feed_layout.addStretch()
+        # Inner container — rows merged in by _update_history_feed
+        self._history_feed = FeedList(self._build_feed_entry_row)
+        self._history_feed.on_load_older = lambda: self._load_older_feed(self._history_feed)
 
-        scroll.setWidget(self._history_feed_container)
+        scroll.setWidget(self._history_feed)
         return scroll
 
     def _uid_to_name(self, uid):
@@ -534,37 +532,58 @@ class LeagueView(QWidget):
         row_layout.addWidget(ts_label, alignment=Qt.AlignmentFlag.AlignTop)
         return row
 
-    def _merge_feed_events(self):
-        """Return sorted (ts, html) pairs from history + chat."""
+    def _build_feed_entry_row(self, entry, source):
+        """Build the feed row for a history or chat entry."""
         from datetime import datetime, timezone
-        events = []
-        for entry in (self.my_league_history or []):
-            events.append((entry.get("created_at", ""), self._format_league_msg(entry.get("message", ""))))
-        for entry in (self.my_league_chat or []):
+        if source == "history":
+            html = self._format_league_msg(entry.get("message", ""))
+        else:
             sender = entry.get("sender", "")
             msg    = entry.get("message", "")
             html   = f"<span style='color:{self.FEED_COLOURS['1']};'>{sender}:</span> <span style='color:#FFFFFF;'>{msg}</span>"
-            events.append((entry.get("created_at", ""), html))
-        events.sort(key=lambda e: e[0], reverse=True)
-        return events
 
-    def _update_history_feed(self):
-        from datetime import datetime, timezone
+        ts = entry.get("created_at", "")
+        try:
+            ts_str = datetime.fromisoformat(ts).astimezone(timezone.utc).strftime("%b %d, %H:%M")
+        except Exception:
+            ts_str = ts[:16] if ts else ""
+        return self._build_feed_row(html, ts_str)
+
+    def _merge_feed(self, feed):
+        """Merge history + chat entries the feed hasn't shown yet."""
+        # a different league's feed is still on screen
+        if feed.scope != self.my_league_id:
+            feed.clear()
+            feed.scope = self.my_league_id
+        feed.has_older = any(Session.feed_has_older.values())
+        # rows past the point where both streams are loaded stay hidden, so
+        # older chat is never spliced in above history already shown
+        feed.merge(Session.feed_window(self.my_league_history), "history")
+        feed.merge(Session.feed_window(self.my_league_chat), "chat")
+
+    def _load_older_feed(self, feed):
+        """Page in older history + chat from the server, then show them."""
+        def _success(pages):
+            Session.apply_older_feed(pages)
+            self.my_league_history = Session.league_history or []
+            self.my_league_chat = Session.league_chat or []
+            self._merge_feed(feed)
+            feed.load_older()
 
-        while self._history_feed_layout.count() > 1:
-            item = self._history_feed_layout.takeAt(0)
-            if item.widget():
-                item.widget().setParent(None)
+        def _error(e):
+            set_status(self, f"Failed to load older messages: {e}", 2)
+
+        run_async(
+            parent_widget=feed,
+            fn=Session.fetch_older_feed,
+            block_cursor=False,
+            on_success=_success,
+            on_error=_error,
+            key=("feed_older", id(feed)),
+        )
 
-        for ts, html in self._merge_feed_events():
-            try:
-                ts_str = datetime.fromisoformat(ts).astimezone(timezone.utc).strftime("%b %d, %H:%M")
-            except Exception:
-                ts_str = ts[:16] if ts else ""
-            self._history_feed_layout.insertWidget(
-                self._history_feed_layout.count() - 1,
-                self._build_feed_row(html, ts_str)
-            )
+    def _update_history_feed(self):
+        self._merge_feed(self._history_feed)
 
     def _build_owner_controls(self):
         self.draft_input = QLineEdit()
@@ -926,12 +945,9 @@ class LeagueView(QWidget):
         scroll.setFrameShape(QFrame.Shape.NoFrame)
         scroll.setStyleSheet(SCROLL_STYLESHEET)
 
-        self._post_feed_container = QWidget()
-        self._post_feed_layout = QVBoxLayout(self._post_feed_container)
-        self._post_feed_layout.setContentsMargins(0, 4, 0, 4)
-        self._post_feed_layout.setSpacing(0)
-        self._post_feed_layout.addStretch()
-        scroll.setWidget(self._post_feed_container)
+        self._post_feed = FeedList(self._build_feed_entry_row)
+        self._post_feed.on_load_older = lambda: self._load_older_feed(self._post_feed)
+        scroll.setWidget(self._post_feed)
 
         post_chat_row = QHBoxLayout()
         self.post_chat_input = QLineEdit()
@@ -970,13 +986,13 @@ class LeagueView(QWidget):
     def _build_portrait_button(self, player: dict, inactive: bool = False) -> QLabel:
         # grab name then image path
         name = player.get("id", "-")
-        pixmap = Session.get_pixmap("players", name)
+        pixmap = Session.get_pixmap("players", name, size=(100, 100))
 
         # return consistent styled image
         image = QLabel()
         image.setFixedSize(100, 100)
         image.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        image.setPixmap(pixmap.scaled(100, 100, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation))
+        image.setPixmap(pixmap)
         image.setStyleSheet("border: 2px solid #BBBBBB;")
         image.setCursor(Qt.CursorShape.PointingHandCursor)
 
@@ -1025,6 +1041,7 @@ class LeagueView(QWidget):
 
     def _update_stat_container(self, player: dict):
         player_id = player.get("id", "-")
+        cancel_async("league_stat_detail")
 
         # empty stat detail cont
         while self.stat_detail_layout.count():
@@ -1075,6 +1092,7 @@ class LeagueView(QWidget):
             block_cursor=False,
             on_success=_success,
             on_error=_error,
+            key="league_stat_detail",
         ))
 
     def _build_stat_card(self, player: dict, timeline: list) -> QScrollArea:
@@ -1106,11 +1124,7 @@ class LeagueView(QWidget):
         image.setStyleSheet("border: 2px solid #FFFFFF;")
         image.setAlignment(Qt.AlignmentFlag.AlignCenter)
         image.setPixmap(
-            Session.get_pixmap("players", name).scaled(
-                180, 180,
-                Qt.AspectRatioMode.IgnoreAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
+            Session.get_pixmap("players", name, size=(180, 180))
         )
         region_img = ResourcePath.FLAGS / f"{region}.png"
         if not region_img.exists():
@@ -1260,6 +1274,7 @@ class LeagueView(QWidget):
 
         def _success(success):
             if success:
+                Session.invalidate("league", "leaderboards", "trades")
                 self._refresh(force=1)
                 set_status(self, "League created successfully!", code=1)
 
@@ -1278,6 +1293,7 @@ class LeagueView(QWidget):
 
         def _success(success):
             if success:
+                Session.invalidate("league", "leaderboards", "trades")
                 self._refresh(force=1)
                 set_status(self, "League joined successfully!", code=1)
 
@@ -1337,6 +1353,7 @@ class LeagueView(QWidget):
 
         def _success(success):
             if success:
+                Session.invalidate("league", "leaderboards", "trades")
                 self._refresh(force=1)
                 set_status(self, "League left successfully!", code=1)
 
@@ -1355,6 +1372,7 @@ class LeagueView(QWidget):
 
         def _success(success):
             if success:
+                Session.invalidate("league", "leaderboards", "trades")
                 self._refresh(force=1)
                 set_status(self, "Draft order assigned successfully!", code=1)
 
@@ -1381,6 +1399,7 @@ class LeagueView(QWidget):
 
         def _success(success):
             if success:
+                Session.invalidate("league", "leaderboards", "trades")
                 self._refresh(force=1)
                 set_status(self, "Draft started successfully!", code=1)
 
@@ -1418,6 +1437,7 @@ class LeagueView(QWidget):
 
         def _success(success):
             if success:
+                Session.invalidate("league", "leaderboards", "trades")
                 self._refresh(force=1)
                 set_status(self, f"Welcome {player} to {self.my_team_name}!", 1)
 
@@ -1436,6 +1456,7 @@ class LeagueView(QWidget):
 
         def _success(success):
             if success:
+                Session.invalidate("league", "leaderboards", "trades")
                 self._refresh(force=1)
                 set_status(self, "Team created successfully!", 1)
 
@@ -1518,18 +1539,22 @@ class LeagueView(QWidget):
 
 # -- REFRESHERS --
 
-    def _refresh(self, force=0):
-        draft_complete_before = getattr(self, "is_draft_complete", None)
-
+    @staticmethod
+    def fetch(force=0):
         Session.init_player_scores()
         Session.init_league_data(force)
 
+    def _refresh(self, force=0, fetch=True):
+        draft_complete_before = getattr(self, "is_draft_complete", None)
+
+        if fetch:
+            self.fetch(force)
+
         league              = Session.league_data or {}
         team                = Session.team_data or {}
 
         self.my_league_history  = Session.league_history or []
         self.my_league_chat     = Session.league_chat or []
-        self._seen_chat_ids     = {e["id"] for e in self.my_league_chat if e.get("id")}
 
         self.my_username        = Session.user
         self.my_user_id         = Session.user_id
@@ -1580,62 +1605,31 @@ class LeagueView(QWidget):
         self._last_fingerprint = new_fingerprint
         self._update_view()
 
-    def _on_realtime_ping(self, topic):
+    def _on_realtime_ping(self, topic, rows):
         if topic == "chat":
-            try:
-                new_chat = Session.league_service.get_league_chat() or []
-            except Exception:
-                return
-            new_entries = [e for e in new_chat if e.get("id") not in self._seen_chat_ids]
-            self._seen_chat_ids.update(e["id"] for e in new_entries if e.get("id"))
-            self.my_league_chat = new_chat
-            for entry in new_entries:
-                self._prepend_chat_row(entry)
-        else:
-            self._refresh(force=1)
-
-    def _prepend_chat_row(self, entry):
-        from datetime import datetime, timezone
-        sender  = entry.get("sender", "")
-        msg     = entry.get("message", "")
-        ts      = entry.get("created_at", "")
-
-        try:
-            dt     = datetime.fromisoformat(ts).astimezone(timezone.utc)
-            ts_str = dt.strftime("%b %d, %H:%M")
-        except Exception:
-            ts_str = ts[:16] if ts else ""
-
-        html = (
-            f"<span style='color:#B39DDB;'>{sender}:</span>"
-            f" <span style='color:#FFFFFF;'>{msg}</span>"
-        )
-
-        for layout in (self._history_feed_layout, self._post_feed_layout):
-            row = QWidget()
-            row_layout = QHBoxLayout(row)
-            row_layout.setContentsMargins(8, 10, 8, 10)
-            row_layout.setSpacing(8)
-
-            bullet = QLabel("•")
-            bullet.setStyleSheet("font-size: 18px; color: #555555;")
-            bullet.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Preferred)
-
-            msg_label = QLabel(f"<span style='font-size:18px; color:#888888;'>{html}</span>")
-            msg_label.setTextFormat(Qt.TextFormat.RichText)
-            msg_label.setWordWrap(True)
-            msg_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+            if rows:
+                Session.apply_league_rows("chat", rows)
+            else:
+                try:
+                    Session.apply_league_rows("chat", Session.fetch_league_rows_since("chat"))
+                except Exception:
+                    return
+            self.my_league_chat = Session.league_chat or []
+            self._merge_feed(self._history_feed)
+            self._merge_feed(self._post_feed)
+            return
 
-            ts_label = QLabel(ts_str)
-            ts_label.setStyleSheet("font-size: 12px; color: #555555;")
-            ts_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            ts_label.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Preferred)
+        Session.apply_realtime(topic, rows)
 
-            row_layout.addWidget(bullet, alignment=Qt.AlignmentFlag.AlignTop)
-            row_layout.addWidget(msg_label)
-            row_layout.addWidget(ts_label, alignment=Qt.AlignmentFlag.AlignTop)
+        # trades only show here once accepted; refresh the trades page if open
+        if topic == "trades":
+            trades_view = self.app.trades_view
+            if trades_view is not None and self.app.stack.currentWidget() is trades_view:
+                trades_view._refresh()
+            if self.app.stack.currentWidget() is not self:
+                return
 
-            layout.insertWidget(0, row)
+        self._refresh()
 
     def _sync_realtime_listener(self):
         league_id = self.my_league_id
@@ -1657,15 +1651,20 @@ class LeagueView(QWidget):
             access_token=auth.access_token,
             refresh_token=auth.refresh_token,
             league_id=league_id,
+            token_provider=auth.get_access_token,
+            gap_fill=Session.fetch_league_rows_since,
         )
         self._realtime_listener.ping.connect(self._on_realtime_ping)
+        self._realtime_listener.connected.connect(Session.set_realtime_connected)
         self._realtime_listener.start()
 
     def _stop_realtime_listener(self):
         if self._realtime_listener is not None:
             self._realtime_listener.ping.disconnect()
+            self._realtime_listener.connected.disconnect()
             self._realtime_listener.stop()
             self._realtime_listener = None
+            Session.realtime_connected = None
 
     def _update_view(self):
         if self.my_league_id:
@@ -1776,22 +1775,7 @@ class LeagueView(QWidget):
         self._update_former_portraits()
 
     def _update_post_draft_feed(self):
-        from datetime import datetime, timezone
-
-        while self._post_feed_layout.count() > 1:
-            item = self._post_feed_layout.takeAt(0)
-            if item.widget():
-                item.widget().setParent(None)
-
-        for ts, html in self._merge_feed_events():
-            try:
-                ts_str = datetime.fromisoformat(ts).astimezone(timezone.utc).strftime("%b %d, %H:%M")
-            except Exception:
-                ts_str = ts[:16] if ts else ""
-            self._post_feed_layout.insertWidget(
-                self._post_feed_layout.count() - 1,
-                self._build_feed_row(html, ts_str)
-            )
+        self._merge_feed(self._post_feed)
 
     def _update_player_slots(self):
         players = self.my_team_standings.get("players", []) if self.my_team_standings else []
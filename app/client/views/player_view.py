@@ -18,7 +18,7 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-from app.client.controllers.async_runner import run_async
+from app.client.controllers.async_runner import cancel_async, run_async
 from app.client.controllers.resource_path import ResourcePath
 from app.client.controllers.session import Session
 from app.client.controllers.sound_manager import SoundManager
@@ -285,6 +285,7 @@ class PlayerView(QWidget):
             self._render_player_list(filtered)
 
     def _show_player_detail(self, player):
+        cancel_async("player_detail")
         while self._detail_page_layout.count():
             item = self._detail_page_layout.takeAt(0)
             if item.widget():
@@ -343,6 +344,7 @@ class PlayerView(QWidget):
                 block_cursor=False,
                 on_success=_success,
                 on_error=_error,
+                key="player_detail",
             ))
 
         detail_scroll = QScrollArea()
@@ -567,5 +569,6 @@ class PlayerView(QWidget):
 
     @staticmethod
     def preload():
-        for player in Session.player_scores or []:
-            Session.get_image("players", player["name"])
+        Session.prefetch_images(
+            ("players", player["name"]) for player in Session.player_scores or []
+        )
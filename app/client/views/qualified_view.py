@@ -160,5 +160,6 @@ class QualifiedView(QWidget):
 
     @staticmethod
     def preload():
-        for player in Session.player_scores or []:
-            Session.get_image("players", player["name"])
+        Session.prefetch_images(
+            ("players", player["name"]) for player in Session.player_scores or []
+        )
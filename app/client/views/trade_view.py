@@ -1008,11 +1008,7 @@ class TradeView(QWidget):
     def _build_avatar(self, user_id, size):
         image = QLabel()
         image.setPixmap(
-            Session.get_pixmap("avatars", str(user_id)).scaled(
-                size, size,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
+            Session.get_pixmap("avatars", str(user_id), size=(size, size), aspect=Qt.AspectRatioMode.KeepAspectRatio)
         )
         return image
 
@@ -1103,16 +1099,17 @@ class TradeView(QWidget):
         for i, trade in enumerate(sorted(trades, key=lambda t: t["completed_at"], reverse=True)):
             table.setRowHeight(i, ROW_H)
 
-            def image_cell(pixmap, tooltip):
+            def image_cell(image_type, key, tooltip):
                 cell = QWidget()
                 cell_layout = QHBoxLayout(cell)
                 cell_layout.setContentsMargins(6, 4, 6, 4)
                 cell_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
                 img = QLabel()
-                img.setPixmap(pixmap.scaled(
-                    75, 75,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
+                # pre-scaled variant is cached, so rebuilds don't rescale
+                img.setPixmap(Session.get_pixmap(
+                    image_type, key,
+                    size=(75, 75),
+                    aspect=Qt.AspectRatioMode.KeepAspectRatio
                 ))
                 cell_layout.addWidget(img)
 
@@ -1139,12 +1136,12 @@ class TradeView(QWidget):
                 return item
 
             # initiator, out, in, team, date
-            table.setCellWidget(i, 0, image_cell(Session.get_pixmap("avatars", str(trade["initiator_id"])), self._get_username(str(trade["initiator_id"]))))
-            table.setCellWidget(i, 1, image_cell(Session.get_pixmap("players", trade["initiator_player"]), trade["initiator_player"]))
-            table.setCellWidget(i, 2, image_cell(Session.get_pixmap("players", trade["receiver_player"]), trade["receiver_player"]))
+            table.setCellWidget(i, 0, image_cell("avatars", str(trade["initiator_id"]), self._get_username(str(trade["initiator_id"]))))
+            table.setCellWidget(i, 1, image_cell("players", trade["initiator_player"], trade["initiator_player"]))
+            table.setCellWidget(i, 2, image_cell("players", trade["receiver_player"], trade["receiver_player"]))
 
             if trade["receiver_id"]:
-                table.setCellWidget(i, 3, image_cell(Session.get_pixmap("avatars", str(trade["receiver_id"])), self._get_username(str(trade["receiver_id"]))))
+                table.setCellWidget(i, 3, image_cell("avatars", str(trade["receiver_id"]), self._get_username(str(trade["receiver_id"]))))
             else:
                 table.setItem(i, 3, text_cell("Pool", "#666666"))
 
@@ -1247,6 +1244,7 @@ class TradeView(QWidget):
 
         def _success(success):
             if success:
+                Session.invalidate("trades", "leaderboards", "league")
                 self._refresh(force=1)
                 set_status(self, "Player traded successfully!", code=1)
 
@@ -1282,6 +1280,7 @@ class TradeView(QWidget):
 
         def _success(success):
             if success:
+                Session.invalidate("trades", "leaderboards", "league")
                 self._refresh(force=1)
                 set_status(self, "Player traded successfully!", code=1)
 
@@ -1317,6 +1316,7 @@ class TradeView(QWidget):
 
         def _success(success):
             if success:
+                Session.invalidate("trades", "leaderboards", "league")
                 self._refresh(force=1)
                 set_status(self, "Request rejected successfully. Low-ball?", code=1)
 
@@ -1352,6 +1352,7 @@ class TradeView(QWidget):
 
         def _success(success):
             if success:
+                Session.invalidate("trades", "leaderboards", "league")
                 self._refresh(force=1)
                 set_status(self, "Request cancelled successfully!", code=1)
 
@@ -1440,6 +1441,7 @@ class TradeView(QWidget):
 
         def _success(success):
             if success:
+                Session.invalidate("trades", "leaderboards", "league")
                 self._refresh(force=1)
                 set_status(self, "Request sent successfully!", code=1)
 
@@ -1536,10 +1538,15 @@ class TradeView(QWidget):
         seconds = total_seconds % 60
         self.countdown_label.setText(f"{days:02d}d {hours:02d}h {minutes:02d}m {seconds:02d}s")
 
-    def _refresh(self, force=0):
+    @staticmethod
+    def fetch(force=0):
         Session.init_trade_data(force)
         Session.init_leaderboards(force)
 
+    def _refresh(self, force=0, fetch=True):
+        if fetch:
+            self.fetch(force)
+
         self.my_username = Session.user
         self.my_user_id = Session.user_id
 
@@ -1660,3 +1667,20 @@ class TradeView(QWidget):
                 layout.addWidget(_create_label(text))
 
         dialog.exec()
+
+    @staticmethod
+    def preload():
+        images = []
+        for team in Session.leaguemate_standings or []:
+            images.append(("avatars", str(team["user_id"])))
+            images.extend(("players", p["player_name"]) for p in team.get("players", []))
+
+        for r in (Session.trade_requests or []) + (Session.trade_history or []):
+            images.append(("players", r["initiator_player"]))
+            images.append(("players", r["receiver_player"]))
+            images.append(("avatars", str(r["initiator_id"])))
+            if r.get("receiver_id"):
+                images.append(("avatars", str(r["receiver_id"])))
+
+        images.extend(("players", p["name"]) for p in Session.trade_players or [])
+        Session.prefetch_images(images)
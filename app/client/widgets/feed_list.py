@@ -0,0 +1,138 @@
+from bisect import bisect_right
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QPushButton, QVBoxLayout, QWidget
+
+from app.client.theme import BUTTON_STYLESHEET_A
+
+
+class FeedList(QWidget):
+    '''
+    Newest-first feed of rows merged from one or more created_at-sorted
+    sources (league history and chat).
+
+    Entries are kept in a sorted model and only new ones are merged in, so a
+    refresh that brings one chat line builds one row. Only the newest
+    `page_size` rows are built; "Load older" reveals the next page, and asks
+    `on_load_older` for more once the model runs out.
+    '''
+    def __init__(self, build_row, page_size=100, parent=None):
+        """
+        build_row(entry, source) -> QWidget for a single entry
+        """
+        super().__init__(parent)
+        self._build_row = build_row
+        self._page_size = page_size
+        self._limit = page_size
+
+        # ascending (created_at, key) plus the entry behind each
+        self._order = []
+        self._entries = {}
+        self._widgets = {}
+        self._source_counts = {}
+
+        # what the entries belong to (e.g. a league id); callers clear() the
+        # feed when it changes
+        self.scope = None
+
+        # set by callers that can fetch entries older than the model holds
+        self.on_load_older = None
+        self.has_older = False
+
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 4, 0, 4)
+        self._layout.setSpacing(0)
+
+        self._older_btn = QPushButton("Load older")
+        self._older_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self._older_btn.setStyleSheet(BUTTON_STYLESHEET_A)
+        self._older_btn.clicked.connect(self.load_older)
+        self._older_btn.hide()
+
+        self._layout.addWidget(self._older_btn, alignment=Qt.AlignmentFlag.AlignHCenter)
+        self._layout.addStretch()
+
+    @staticmethod
+    def _key(entry, source):
+        if entry.get("id") is not None:
+            return (source, entry["id"])
+        return (source, entry.get("created_at"))
+
+    def merge(self, entries, source):
+        """
+        Adds entries from `source` not already shown. Sources only grow at
+        the tail, so this walks back from the newest entry until it meets one
+        it knows, and falls back to a full pass only if that missed some.
+        """
+        entries = entries or []
+        added = 0
+        for entry in reversed(entries):
+            if self._key(entry, source) in self._entries:
+                break
+            added += self._insert(entry, source)
+
+        if self._source_counts.get(source, 0) + added < len(entries):
+            for entry in entries:
+                if self._key(entry, source) not in self._entries:
+                    added += self._insert(entry, source)
+
+        self._source_counts[source] = self._source_counts.get(source, 0) + added
+        self._update_older_btn()
+
+    def _insert(self, entry, source):
+        key = self._key(entry, source)
+        sort_key = (entry.get("created_at") or "", key)
+
+        idx = bisect_right(self._order, sort_key)
+        self._order.insert(idx, sort_key)
+        self._entries[key] = (entry, source)
+
+        # rows are laid out newest first
+        position = len(self._order) - 1 - idx
+        if position < self._limit:
+            self._show(key, position)
+
+            # push the oldest visible row out of the window
+            if len(self._order) > self._limit:
+                self._hide(self._order[len(self._order) - 1 - self._limit][1])
+        return 1
+
+    def _show(self, key, position):
+        entry, source = self._entries[key]
+        widget = self._build_row(entry, source)
+        self._widgets[key] = widget
+        self._layout.insertWidget(position, widget)
+
+    def _hide(self, key):
+        widget = self._widgets.pop(key, None)
+        if widget is not None:
+            self._layout.removeWidget(widget)
+            widget.setParent(None)
+            widget.deleteLater()
+
+    def load_older(self):
+        """Shows the next page of older rows, fetching more if needed."""
+        total = len(self._order)
+        if self._limit >= total:
+            if self.on_load_older is not None and self.has_older:
+                self.on_load_older()
+            return
+
+        new_limit = self._limit + self._page_size
+        for position in range(self._limit, min(new_limit, total)):
+            self._show(self._order[total - 1 - position][1], position)
+        self._limit = new_limit
+        self._update_older_btn()
+
+    def _update_older_btn(self):
+        self._older_btn.setVisible(len(self._order) > self._limit or self.has_older)
+
+    def clear(self):
+        for key in list(self._widgets):
+            self._hide(key)
+        self._order.clear()
+        self._entries.clear()
+        self._source_counts.clear()
+        self._limit = self._page_size
+        self.has_older = False
+        self._update_older_btn()
@@ -20,6 +20,7 @@ from app.client.controllers.resource_path import ResourcePath
 from app.client.controllers.sound_manager import SoundManager
 from app.client.theme import *
 from app.client.widgets.settings_dialog import SettingsDialog
+from app.client.widgets.spinner import SpinnerWidget
 
 class RefreshButton(QPushButton):
     refresh_requested = pyqtSignal()
@@ -107,11 +108,24 @@ class HeaderBar(QWidget):
 
         self.refresh_button = RefreshButton()
 
+        # shown next to the refresh button while a refresh runs
+        self.refresh_spinner = SpinnerWidget(size=32, color="#FFFFFF")
+        self.refresh_spinner.stop()
+        self.refresh_spinner.setVisible(False)
+
+        layout.addWidget(self.refresh_spinner)
         layout.addWidget(self.refresh_button)
         layout.addWidget(help_button)
         layout.addWidget(settings_button)
         layout.addWidget(logout_button)
 
+    def set_refreshing(self, busy: bool):
+        self.refresh_spinner.setVisible(busy)
+        if busy:
+            self.refresh_spinner.start()
+        else:
+            self.refresh_spinner.stop()
+
     def refresh(self):
         layout = self.layout()
 
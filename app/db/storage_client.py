@@ -0,0 +1,51 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# connect, read timeouts in seconds for every storage fetch
+STORAGE_TIMEOUT = (5, 10)
+
+# max keep-alive connections held per host, storage is a single host so this
+# also caps concurrent image downloads
+_POOL_MAXSIZE = 10
+
+_session = None
+_session_lock = threading.Lock()
+
+def get_storage_session():
+    """
+    Returns the shared keep-alive HTTP session used for all Supabase storage
+    downloads (avatars, event images, player portraits).
+
+    The session is built once per process and is safe to share between
+    threads. Connections are pooled per host and idempotent requests are
+    retried with exponential backoff on connection errors and 429/5xx.
+    """
+    global _session
+
+    if _session is not None:
+        return _session
+
+    with _session_lock:
+        if _session is None:
+            retry = Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset({"GET", "HEAD"}),
+                respect_retry_after_header=True,
+            )
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=_POOL_MAXSIZE,
+                pool_block=True,
+                max_retries=retry,
+            )
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+
+    return _session
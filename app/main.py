@@ -12,6 +12,7 @@ from PyQt6.QtCore import Qt
 
 from app.client.app import FantasyApp
 from app.client.controllers.image_cache import ImageCache
+from app.client.controllers.session import Session
 from app.client.controllers.sound_manager import SoundManager
 from app.client.controllers.resource_path import ResourcePath
 from app.client.theme import *
@@ -33,6 +34,9 @@ def main():
     app = QApplication(sys.argv)
 
     ImageCache.init(appdata_dir / "cache")
+    app.aboutToQuit.connect(ImageCache.flush)
+    Session.init_snapshot(appdata_dir / "session.snapshot")
+    app.aboutToQuit.connect(Session.save_snapshot)
     SoundManager.init()
     SoundManager.load_settings() 
 
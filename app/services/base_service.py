@@ -1,8 +1,10 @@
 import io
 import os
+import threading
 import uuid
 from PIL import Image
-import requests
+
+from app.db.storage_client import get_storage_session, STORAGE_TIMEOUT
 
 class BaseService:
     """
@@ -33,6 +35,10 @@ class BaseService:
         __init__(supabase: Client, user_id: str, access_token: str, refresh_token: str):
             Sets all the class attributes.
 
+        get_access_token() -> str:
+            Returns the current access token, refreshing the session first
+            if it has expired.
+
         verify_query(query: query) -> APIResponse:
             Verifies a query by ensuring it is executed without issue and
             actually returns data. Returns the APIResponse or None if the 
@@ -46,8 +52,10 @@ class BaseService:
             Retrieves a user's avatar as raw bytes suitable for loading
             into a QPixmap.
 
-        get_image(bucket: str, filename: str) -> tuple[bytes, str] | tuple[None, None]:
-            Fetches image bytes and ETag from a Supabase storage bucket.
+        get_image(bucket: str, filename: str, etag: str = None) -> tuple[bytes | None, str | None]:
+            Fetches image bytes and ETag from a Supabase storage bucket. When
+            an ETag is given the request is conditional, and an unchanged
+            image returns (None, etag) without a body.
 
         get_image_etag(bucket: str, filename: str) -> str | None:
             Fetches only the ETag for an image via HEAD request, without
@@ -64,6 +72,11 @@ class BaseService:
             Returns the authenticated user's team UUID, or None if
             they do not have a team.
 
+        invalidate_identity(*keys: str) -> None:
+            Drops memoized identity lookups ("username", "league", "team")
+            so the next call hits the database. Clears all when no keys
+            are given.
+
         get_system_state() -> dict | None:
             Returns the most recent system state record, containing
             blocking status, warning message, banner message, version,
@@ -75,8 +88,30 @@ class BaseService:
         self.access_token = access_token
         self.refresh_token = refresh_token
 
+        # memoized identity lookups, only change through the user's own
+        # league/team actions which call invalidate_identity()
+        self._identity = {}
+        self._identity_lock = threading.Lock()
+        # bumped by invalidate_identity so in-flight loads don't store stale values
+        self._identity_gen = {}
+        self._identity_epoch = 0
+
         self.supabase.auth.set_session(access_token, refresh_token)
         
+    def get_access_token(self):
+        """
+        Current access token, refreshed through the auth client first if
+        it has expired. Falls back to the last known token on failure.
+        """
+        try:
+            session = self.supabase.auth.get_session()
+            if session:
+                self.access_token = session.access_token
+                self.refresh_token = session.refresh_token
+        except Exception:
+            pass
+        return self.access_token
+
     def verify_query(self, query):
         try:
             result = query.execute()
@@ -178,23 +213,29 @@ class BaseService:
                 return None
 
             # fetch image bytes
-            response = requests.get(avatar_url)
+            response = get_storage_session().get(avatar_url, timeout=STORAGE_TIMEOUT)
             response.raise_for_status()  # raise error if download failed
             return response.content
 
         except Exception as e:
             raise Exception (f"Failed to get avatar for user {user_id}: {e}")
 
-    def get_image(self, bucket, filename):
+    def get_image(self, bucket, filename, etag=None):
         """
         Fetches image bytes and ETag from a Supabase storage bucket.
         Returns (bytes, etag) or (None, None) if not found.
+
+        If etag is given, sends If-None-Match and returns (None, etag) when
+        the server answers 304 Not Modified.
         """
         try:
             url = self.supabase.storage.from_(bucket).get_public_url(filename)
             if not url:
                 return None, None
-            response = requests.get(url)
+            headers = {"If-None-Match": etag} if etag else None
+            response = get_storage_session().get(url, headers=headers, timeout=STORAGE_TIMEOUT)
+            if etag and response.status_code == 304:
+                return None, etag
             response.raise_for_status()
             etag = response.headers.get("ETag", "")
             return response.content, etag
@@ -209,47 +250,83 @@ class BaseService:
             url = self.supabase.storage.from_(bucket).get_public_url(filename)
             if not url:
                 return None
-            response = requests.head(url)
+            response = get_storage_session().head(url, timeout=STORAGE_TIMEOUT)
             response.raise_for_status()
             return response.headers.get("ETag")
         except Exception:
             return None
 
+    def _cached_identity(self, key, loader):
+        with self._identity_lock:
+            if key in self._identity:
+                return self._identity[key]
+            generation = (self._identity_epoch, self._identity_gen.get(key, 0))
+
+        value = loader()
+
+        with self._identity_lock:
+            if generation == (self._identity_epoch, self._identity_gen.get(key, 0)):
+                self._identity[key] = value
+        return value
+
+    def invalidate_identity(self, *keys):
+        """
+        Drops memoized identity lookups. Called after anything that changes
+        the user's league or team membership.
+        """
+        with self._identity_lock:
+            if not keys:
+                self._identity.clear()
+                self._identity_epoch += 1
+                return
+            for key in keys:
+                self._identity.pop(key, None)
+                self._identity_gen[key] = self._identity_gen.get(key, 0) + 1
+
     def get_my_username(self):
-        result = self.verify_query((
-            self.supabase
-            .table("managers")
-            .select("manager_name")
-            .eq("user_id", self.user_id)
-            ))
-        
-        return result.data[0]["manager_name"]
+        def _load():
+            result = self.verify_query((
+                self.supabase
+                .table("managers")
+                .select("manager_name")
+                .eq("user_id", self.user_id)
+                ))
+            
+            return result.data[0]["manager_name"]
+
+        return self._cached_identity("username", _load)
 
     def get_my_league(self):
-        result = self.verify_query((
-            self.supabase
-            .table("managers")
-            .select("league_id")
-            .eq("user_id", self.user_id)
-            ))
-        
-        if not result.data:
-            return None
+        def _load():
+            result = self.verify_query((
+                self.supabase
+                .table("managers")
+                .select("league_id")
+                .eq("user_id", self.user_id)
+                ))
+            
+            if not result.data:
+                return None
 
-        return result.data[0]["league_id"]
+            return result.data[0]["league_id"]
+
+        return self._cached_identity("league", _load)
 
     def get_my_team(self):
-        result = self.verify_query((
-            self.supabase
-            .table("teams")
-            .select("team_id")
-            .eq("team_owner", self.user_id)
-            ))
-        
-        if not result.data:
-            return None
+        def _load():
+            result = self.verify_query((
+                self.supabase
+                .table("teams")
+                .select("team_id")
+                .eq("team_owner", self.user_id)
+                ))
+            
+            if not result.data:
+                return None
+
+            return result.data[0]["team_id"]
 
-        return result.data[0]["team_id"]
+        return self._cached_identity("team", _load)
 
     def get_system_state(self):
         result = self.verify_query((
@@ -1,8 +1,18 @@
-import requests
-
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from app.db.storage_client import get_storage_session, STORAGE_TIMEOUT
 from app.services.base_service import BaseService
+from app.services.points_timeline import PointsTimeline
+from app.services.roster_index import RosterIndex
+
+# rosters only move during the draft and trade windows, and Session drops the
+# index on any league/trade mutation, so this is just a backstop
+ROSTER_INDEX_TTL = 300
+
+# postgrest caps rows per response, so bulk reads are paged
+PAGE_SIZE = 1000
 
 
 class EventService():
@@ -41,13 +51,33 @@ class EventService():
             None if no teams are found. Raises if not in a league or the
             event is incomplete.
 
+        get_roster_index(league_id: str) -> RosterIndex:
+            Returns the cached roster tenure index for a league, fetching
+            it if missing or older than ROSTER_INDEX_TTL.
+
+        invalidate_roster_index(league_id: str | None = None):
+            Drops the cached roster index for a league, or all of them.
+
+        get_league_score_matrix(league_id: str) -> dict:
+            Returns every team's scores for every completed event of the
+            season in one pass; see league_scores_from_matrix and
+            user_scores_from_matrix for per-event lookups.
+
         get_player_points_timeline(player: str, joined_at: str | None, left_at: str | None) -> list[dict]:
             Returns a chronological list of score history entries for a player
             within their tenure on a team. Each entry includes event name,
             event date, points gained, and cumulative points after that event.
+            The player's full history is cached after the first call.
+
+        invalidate_timelines():
+            Drops every cached points timeline, e.g. after a score update.
     """
     def __init__(self, base: BaseService):
         self.base = base
+        self._roster_indexes = {}
+        self._roster_lock = threading.Lock()
+        self._timelines = {}
+        self._timeline_lock = threading.Lock()
 
     def __getattr__(self, name):
         return getattr(self.base, name)
@@ -80,7 +110,7 @@ class EventService():
                 image_url = self.supabase.storage.from_(BUCKET).get_public_url(image_name)
                 if not image_url:
                     return None
-                response = requests.get(image_url, timeout=10)
+                response = get_storage_session().get(image_url, timeout=STORAGE_TIMEOUT)
                 response.raise_for_status()
                 data = response.content
                 ImageCache.store("events", cache_key, data, etag="")
@@ -124,6 +154,58 @@ class EventService():
 
         return score_history
     
+    def get_roster_index(self, league_id):
+        with self._roster_lock:
+            cached = self._roster_indexes.get(league_id)
+        if cached and time.monotonic() - cached[0] < ROSTER_INDEX_TTL:
+            return cached[1]
+
+        teams = self.verify_query(
+            self.supabase
+            .table("teams")
+            .select("""
+                team_id,
+                owner:managers!teams_team_owner_fkey(
+                    manager_name
+                )
+            """)
+            .eq("league_id", league_id)
+        ).data
+
+        rows = self.verify_query(
+            self.supabase
+            .table("team_players")
+            .select("""
+                team_id,
+                player_name,
+                joined_at,
+                left_at
+            """)
+            .eq("league_id", league_id)
+        ).data
+
+        index = RosterIndex(
+            [
+                {
+                    "team_id": t["team_id"],
+                    "username": t["owner"]["manager_name"] if t["owner"] else None
+                }
+                for t in teams
+            ],
+            rows
+        )
+
+        with self._roster_lock:
+            self._roster_indexes[league_id] = (time.monotonic(), index)
+        return index
+
+    def invalidate_roster_index(self, league_id=None):
+        with self._roster_lock:
+            if league_id is None:
+                self._roster_indexes.clear()
+            else:
+                self._roster_indexes.pop(league_id, None)
+
     def get_user_event_scores(self, team_id, event_id):
         '''
         Returns a players active team at the time of the tournament and how
@@ -155,31 +237,19 @@ class EventService():
         if event["complete"] == False:
             raise Exception("This tournament is not complete yet!")
 
-        # grab players of team and event date
-        players = self.verify_query(
-            self.supabase
-            .table("team_players")
-            .select("""
-                player_name,
-                joined_at,
-                left_at
-            """)
-            .eq("team_id", team_id)
-        ).data
-
-        # filter all players to active ones (at time of event)
-        start_weekend = datetime.fromisoformat(event["start_weekend"].replace("Z", "+00:00"))
-        filtered_players = [
-            p for p in players
-            if datetime.fromisoformat(p["joined_at"].replace("Z", "+00:00")) <= start_weekend
-            and (
-                p["left_at"] is None or
-                datetime.fromisoformat(p["left_at"].replace("Z", "+00:00")) > start_weekend
-            )
-        ]
+        # roster at the time of the event
+        if league_id:
+            roster_index = self.get_roster_index(league_id)
+        else:
+            roster_index = RosterIndex([], self.verify_query(
+                self.supabase
+                .table("team_players")
+                .select("team_id, player_name, joined_at, left_at")
+                .eq("team_id", team_id)
+            ).data)
+        player_names = roster_index.roster_at(team_id, event["start_weekend"])
 
         # returns empty if no players were active at that point
-        player_names = [p["player_name"] for p in filtered_players]
         if not player_names:
             return None
 
@@ -195,11 +265,11 @@ class EventService():
         score_lookup = {sh["player"]: {"points": sh["points"], "rank": sh["rank"]} for sh in score_history}
         standings = [
             {
-                "player": p["player_name"],
-                "points": score_lookup.get(p["player_name"], {"points": 0, "rank": None})["points"],
-                "rank": score_lookup.get(p["player_name"], {"points": 0, "rank": None})["rank"]
+                "player": name,
+                "points": score_lookup.get(name, {"points": 0, "rank": None})["points"],
+                "rank": score_lookup.get(name, {"points": 0, "rank": None})["rank"]
             }
-            for p in filtered_players
+            for name in player_names
         ]
         
         return standings
@@ -230,58 +300,21 @@ class EventService():
             .eq("id", event_id)
             .single()
         ).data
-        start_weekend = datetime.fromisoformat(event["start_weekend"].replace("Z", "+00:00"))
 
         if not event["complete"]:
             raise Exception("This tournament is not complete yet!")
 
-        # fetch all teams in the league and their owners
-        teams = self.verify_query(
-            self.supabase
-            .table("teams")
-            .select("""
-                team_id,
-                owner:managers!teams_team_owner_fkey(
-                    manager_name,
-                    user_id
-                )
-            """)
-            .eq("league_id", league_id)
-        ).data
-
-        if not teams:
+        index = self.get_roster_index(league_id)
+        if not index.team_to_user:
             return None
 
-        # map team_id → username
-        team_to_user = {t["team_id"]: t["owner"]["manager_name"] for t in teams}
-
-        leaguemate_ids = list(team_to_user.keys())
-
-        # fetch all players for these teams
-        all_players = self.verify_query(
-            self.supabase
-            .table("team_players")
-            .select("""
-                team_id,
-                player_name,
-                joined_at,
-                left_at
-            """)
-            .in_("team_id", leaguemate_ids)
-        ).data
-
-        # filter active players at event start
-        active_players = [
-            p for p in all_players
-            if datetime.fromisoformat(p["joined_at"].replace("Z", "+00:00")) <= start_weekend
-            and (p["left_at"] is None or datetime.fromisoformat(p["left_at"].replace("Z", "+00:00")) > start_weekend)
-        ]
-
-        if not active_players:
+        # active rosters at event start, grouped by team
+        active = index.active_at(event["start_weekend"])
+        if not active:
             return {}
 
         # fetch score history for active players
-        player_names = [p["player_name"] for p in active_players]
+        player_names = [name for names in active.values() for name in names]
         all_scores = self.verify_query(
             self.supabase
             .table("score_history")
@@ -294,31 +327,157 @@ class EventService():
         score_lookup = {sh["player"]: {"points": sh["points"], "rank": sh["rank"]} for sh in all_scores}
 
         standings_by_user = {}
-        for team_id, username in team_to_user.items():
-            team_players = [p for p in active_players if p["team_id"] == team_id]
+        for team_id, username in index.team_to_user.items():
+            team_players = active.get(team_id)
             if team_players:
                 standings_by_user[username] = {
-                    p["player_name"]: {
-                        "points": score_lookup.get(p["player_name"], {"points": 0, "rank": None})["points"],
-                        "rank": score_lookup.get(p["player_name"], {"points": 0, "rank": None})["rank"]
+                    name: {
+                        "points": score_lookup.get(name, {"points": 0, "rank": None})["points"],
+                        "rank": score_lookup.get(name, {"points": 0, "rank": None})["rank"]
                     }
-                    for p in team_players
+                    for name in team_players
                 }
 
         return standings_by_user
 
-    def get_player_points_timeline(self, player, joined_at=None, left_at=None):
-        score_history = self.verify_query(
+    def get_league_score_matrix(self, league_id):
+        """
+        Computes the team x event score matrix for a league's season: one
+        fetch of score_history for every completed event, joined against the
+        roster index. Returns:
+            {
+                "league_id", "draft_complete",
+                "complete": {event_id: bool},
+                "team_to_user": {team_id: username},
+                "scores": {event_id: {team_id: [{"player", "points", "rank"}]}}
+            }
+        """
+        if league_id == None:
+            raise Exception("You are not part of a league!")
+
+        league = self.verify_query(
             self.supabase
-            .table("score_history")
-            .select("""
-                events(name, start_weekend),
-                rank,
-                points
-            """)
-            .eq("player", player)
+            .table("leagues")
+            .select("draft_complete")
+            .eq("league_id", league_id)
+            .single()
+        ).data
+
+        events = self.verify_query(
+            self.supabase
+            .table("events")
+            .select("id, start_weekend, complete")
         ).data
 
+        index = self.get_roster_index(league_id)
+
+        # who was on each team at each completed event
+        rosters = {
+            e["id"]: index.active_at(e["start_weekend"])
+            for e in events if e["complete"]
+        }
+        player_names = sorted({
+            name
+            for active in rosters.values()
+            for names in active.values()
+            for name in names
+        })
+
+        score_lookup = {}
+        if rosters and player_names:
+            offset = 0
+            while True:
+                page = self.verify_query(
+                    self.supabase
+                    .table("score_history")
+                    .select("event, player, rank, points")
+                    .in_("event", list(rosters.keys()))
+                    .in_("player", player_names)
+                    .order("event")
+                    .order("player")
+                    .range(offset, offset + PAGE_SIZE - 1)
+                ).data or []
+                for sh in page:
+                    score_lookup[(sh["event"], sh["player"])] = sh
+                if len(page) < PAGE_SIZE:
+                    break
+                offset += PAGE_SIZE
+
+        scores = {}
+        for event_id, active in rosters.items():
+            scores[event_id] = {
+                team_id: [
+                    {
+                        "player": name,
+                        "points": score_lookup[(event_id, name)]["points"] if (event_id, name) in score_lookup else 0,
+                        "rank": score_lookup[(event_id, name)]["rank"] if (event_id, name) in score_lookup else None
+                    }
+                    for name in names
+                ]
+                for team_id, names in active.items()
+            }
+
+        return {
+            "league_id": league_id,
+            "draft_complete": league.get("draft_complete") == True,
+            "complete": {e["id"]: bool(e["complete"]) for e in events},
+            "team_to_user": dict(index.team_to_user),
+            "scores": scores
+        }
+
+    @staticmethod
+    def _check_matrix_event(matrix, event_id):
+        if not matrix["draft_complete"]:
+            raise Exception("Your league's draft is not complete yet!")
+        if not matrix["complete"].get(event_id):
+            raise Exception("This tournament is not complete yet!")
+
+    @staticmethod
+    def user_scores_from_matrix(matrix, team_id, event_id):
+        """Same result as get_user_event_scores, read from a score matrix."""
+        if team_id == None:
+            raise Exception("You don't have a team!")
+        EventService._check_matrix_event(matrix, event_id)
+
+        return matrix["scores"][event_id].get(team_id) or None
+
+    @staticmethod
+    def league_scores_from_matrix(matrix, event_id):
+        """Same result as get_league_event_scores, read from a score matrix."""
+        EventService._check_matrix_event(matrix, event_id)
+
+        if not matrix["team_to_user"]:
+            return None
+
+        event_scores = matrix["scores"][event_id]
+        return {
+            username: {
+                p["player"]: {"points": p["points"], "rank": p["rank"]}
+                for p in event_scores[team_id]
+            }
+            for team_id, username in matrix["team_to_user"].items()
+            if event_scores.get(team_id)
+        }
+
+    def get_player_points_timeline(self, player, joined_at=None, left_at=None):
+        with self._timeline_lock:
+            timeline = self._timelines.get(player)
+
+        if timeline is None:
+            score_history = self.verify_query(
+                self.supabase
+                .table("score_history")
+                .select("""
+                    events(name, start_weekend),
+                    rank,
+                    points
+                """)
+                .eq("player", player)
+            ).data
+            timeline = PointsTimeline(score_history)
+            with self._timeline_lock:
+                self._timelines[player] = timeline
+
         def parse_dt(dt_str):
             if dt_str is None:
                 return None
@@ -332,20 +491,8 @@ class EventService():
         joined_dt = parse_dt(joined_at) or default_joined
         left_dt = parse_dt(left_at) or datetime.max.replace(tzinfo=timezone.utc)
 
-        history = [
-            sh for sh in score_history
-            if joined_dt <= parse_dt(sh["events"]["start_weekend"]) <= left_dt
-        ]
-        history.sort(key=lambda x: x["events"]["start_weekend"])
-        running = 0
-        timeline = []
-        for h in history:
-            running += h["points"]
-            timeline.append({
-                "event_name": h["events"]["name"],
-                "event_date": h["events"]["start_weekend"],
-                "points_gained": h["points"],
-                "rank": h["rank"],
-                "points_after": running
-            })
-        return timeline
+        return timeline.window(joined_dt, left_dt)
+
+    def invalidate_timelines(self):
+        with self._timeline_lock:
+            self._timelines.clear()
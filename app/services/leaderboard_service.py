@@ -8,8 +8,9 @@ class LeaderboardService():
     get_my_standings() -> jsonb
         Returns the user's team's player standings
 
-    get_leaguemate_standings() -> jsonb
-        Returns the standings of all players in all teams of a user's league
+    get_leaguemate_standings(limit=None, offset=0) -> jsonb
+        Returns the standings of all players in all teams of a user's league,
+        highest total first, optionally one page of teams at a time
 
     get_player_cum_points() -> jsonb
         Returns the total cumulative point standings of all players
@@ -20,98 +21,24 @@ class LeaderboardService():
     def __getattr__(self, name):
         return getattr(self.base, name)
 
-    def get_leaguemate_standings(self):
+    def get_leaguemate_standings(self, limit=None, offset=0):
         # validating league state
         my_league = self.get_my_league()
 
         if not my_league:
             raise Exception("You're not in a league!")
 
-        data = self.verify_query(
-            self.supabase
-            .table("teams")
-            .select("""
-                team_id,
-                team_name,
-                owner:managers!teams_team_owner_fkey(
-                    manager_name, 
-                    user_id
-                ),
-                roster:team_players(
-                    team_id,
-                    player_name,
-                    points,
-                    joined_at,
-                    left_at
-                )
-            """)
-            .eq("league_id", my_league)
-        ).data
-
-        team_name_map = {t["team_id"]: t["team_name"] for t in data}
-
-        owner_map = {
-            t["team_id"]: {
-                "username": t["owner"]["manager_name"] if t["owner"] else None,
-                "user_id": t["owner"]["user_id"] if t["owner"] else None
-            }
-            for t in data
-        }
-
-        rosters = [
-            player
-            for t in data
-            for player in (t["roster"] or [])
-        ]
-
-        standings = {}
-
-        # formatting stuff
-        for row in rosters:
-            team_id = row["team_id"]
-
-            if team_id not in standings:
-                standings[team_id] = {
-                    "team_name": team_name_map.get(team_id),
-                    "owner_username": owner_map.get(team_id),
-                    "user_id": owner_map.get(team_id, {}).get("user_id"),
-                    "players": []
-                }
-
-            standings[team_id]["players"].append({
-                "player_name": row["player_name"],
-                "points": row["points"],
-                "active": row["left_at"] is None,
-                "joined_at": row["joined_at"],
-                "left_at": row["left_at"]
+        # totals and roster splits are aggregated server side
+        # (admin/sql/get_league_standings.sql), ordered by total points
+        result = self.verify_query(
+            self.supabase.rpc("get_league_standings", {
+                "p_league_id": my_league,
+                "p_limit": limit,
+                "p_offset": offset
             })
+        )
 
-        return [
-            {
-                "team_name": data["team_name"],
-                "user_name": data["owner_username"]["username"],
-                "user_id": data["user_id"],
-                "players": [
-                    {
-                        "player_name": p["player_name"],
-                        "points": p["points"],
-                        "joined_at": p["joined_at"]
-                    }
-                    for p in data["players"] if p["active"]
-                ],
-                "former_players": [
-                    {
-                        "player_name": p["player_name"],
-                        "points": p["points"],
-                        "joined_at": p["joined_at"],
-                        "left_at": p["left_at"]
-                    }
-                    for p in data["players"] if not p["active"]
-                ],
-                "total_points": sum(p["points"] for p in data["players"])
-            }
-            for team_id, data in standings.items()
-        ]
+        return result.data if result else []
 
     def get_players(self):  
         players = self.verify_query(
@@ -146,6 +146,7 @@ class LeagueService():
             .update({"league_id": result.data[0]["league_id"]})
             .eq("user_id", self.user_id)
             )
+        self.invalidate_identity("league", "team")
         
         return self.get_my_league()
 
@@ -186,6 +187,7 @@ class LeagueService():
             .update({"league_id": league_id})
             .eq("user_id", self.user_id)
             )
+        self.invalidate_identity("league", "team")
 
         return True
 
@@ -232,6 +234,7 @@ class LeagueService():
                     .delete()
                     .eq("team_id", my_team)
                 )
+                self.invalidate_identity("team")
 
             # delete the league
             self.verify_query(
@@ -240,6 +243,7 @@ class LeagueService():
                 .delete()
                 .eq("league_id", my_league)
             )
+            self.invalidate_identity("league", "team")
 
             return True
             
@@ -252,6 +256,7 @@ class LeagueService():
                     .delete()
                     .eq("team_id", my_team)
                 )
+                self.invalidate_identity("team")
 
             # remove the user from the league
             self.verify_query(
@@ -260,6 +265,7 @@ class LeagueService():
                 .update({"league_id": None})
                 .eq("user_id", self.user_id)
                 )
+            self.invalidate_identity("league", "team")
             
             return True
         
@@ -395,35 +401,69 @@ class LeagueService():
 
         return True
 
-    def get_league_history(self):
+    def _page_league_rows(self, query, since, before, limit):
+        """
+        Keyset paging on (created_at, id), rows always returned oldest first.
+        Rows written in one transaction share created_at, so id breaks ties.
+        since: (created_at, id) cursor, rows after it
+        before: (created_at, id) cursor, rows before it
+        A cursor with no id matches its own created_at too; callers dedupe.
+        limit: only the newest `limit` rows of what matches
+        """
+        if since is not None:
+            query = self._keyset_filter(query, "gt", *since)
+        if before is not None:
+            query = self._keyset_filter(query, "lt", *before)
+
+        if limit is None:
+            result = self.verify_query(
+                query.order("created_at", desc=False).order("id", desc=False)
+            )
+            return result.data if result else []
+
+        result = self.verify_query(
+            query.order("created_at", desc=True).order("id", desc=True).limit(limit)
+        )
+        return list(reversed(result.data)) if result else []
+
+    @staticmethod
+    def _keyset_filter(query, op, created_at, row_id):
+        if row_id is None:
+            if op == "gt":
+                return query.gte("created_at", created_at)
+            return query.lte("created_at", created_at)
+
+        # created_at op X, or created_at = X and id op ID
+        return query.or_(
+            f'created_at.{op}."{created_at}",'
+            f'and(created_at.eq."{created_at}",id.{op}.{row_id})'
+        )
+
+    def get_league_history(self, since=None, before=None, limit=None):
         league_id = self.get_my_league()
         if not league_id:
             raise Exception("You are not in a league.")
 
-        result = self.verify_query((
+        return self._page_league_rows(
             self.supabase
             .table("league_history")
             .select("*")
-            .eq("league_id", league_id)
-            .order("created_at", desc=False,)
-        ))
-
-        return result.data
+            .eq("league_id", league_id),
+            since, before, limit
+        )
 
-    def get_league_chat(self):
+    def get_league_chat(self, since=None, before=None, limit=None):
         league_id = self.get_my_league()
         if not league_id:
             return []
 
-        result = self.verify_query((
+        return self._page_league_rows(
             self.supabase
             .table("league_chat")
             .select("*")
-            .eq("league_id", league_id)
-            .order("created_at", desc=False)
-        ))
-
-        return result.data if result else []
+            .eq("league_id", league_id),
+            since, before, limit
+        )
 
     _last_chat_sent: float = 0.0
 
@@ -0,0 +1,44 @@
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+
+
+def _parse_dt(value: str) -> datetime:
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+class PointsTimeline:
+    """
+    One player's score history sorted by event date, with running point
+    totals, so the points for any tenure window come from two bisects
+    rather than a refetch and re-accumulation.
+    """
+
+    def __init__(self, score_history: list[dict]):
+        history = sorted(score_history, key=lambda x: x["events"]["start_weekend"])
+        self._entries = history
+        self._dates = [_parse_dt(h["events"]["start_weekend"]) for h in history]
+
+        # prefix[i] is the total of the first i entries
+        self._prefix = [0]
+        for h in history:
+            self._prefix.append(self._prefix[-1] + h["points"])
+
+    def window(self, joined_dt: datetime, left_dt: datetime) -> list[dict]:
+        """Entries with joined_dt <= event date <= left_dt, cumulative from joined_dt."""
+        lo = bisect_left(self._dates, joined_dt)
+        hi = bisect_right(self._dates, left_dt)
+        base = self._prefix[lo]
+
+        return [
+            {
+                "event_name": self._entries[i]["events"]["name"],
+                "event_date": self._entries[i]["events"]["start_weekend"],
+                "points_gained": self._entries[i]["points"],
+                "rank": self._entries[i]["rank"],
+                "points_after": self._prefix[i + 1] - base
+            }
+            for i in range(lo, hi)
+        ]
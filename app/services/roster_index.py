@@ -0,0 +1,63 @@
+from bisect import bisect_right
+from datetime import datetime, timezone
+
+
+def _parse_ts(value: str) -> float:
+    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+class RosterIndex:
+    """
+    Pre-parsed roster tenures for one league, answering "who was on which
+    team at time T" with a binary search.
+
+    Every joined_at / left_at is parsed once. Those timestamps split time
+    into segments within which no roster changes, and the active
+    (team_id, player_name) rows are stored per segment, so a lookup is one
+    bisect over the change points instead of a pass over every row.
+
+    A player counts as active at T when joined_at <= T < left_at, matching
+    the original per-event filter.
+    """
+
+    def __init__(self, teams: list[dict], rows: list[dict]):
+        """
+        teams: [{"team_id", "username"}] for the league
+        rows: team_players rows with team_id, player_name, joined_at, left_at
+        """
+        self.team_to_user = {t["team_id"]: t["username"] for t in teams}
+
+        tenures = []
+        for row in rows:
+            joined = _parse_ts(row["joined_at"])
+            left = _parse_ts(row["left_at"]) if row["left_at"] is not None else float("inf")
+            tenures.append((joined, left, row["team_id"], row["player_name"]))
+        tenures.sort(key=lambda t: t[0])
+
+        self._bounds = sorted({t for tenure in tenures for t in tenure[:2] if t != float("inf")})
+
+        # segment i covers [bounds[i - 1], bounds[i]); segment 0 is before any join
+        self._segments = [{}]
+        for start in self._bounds:
+            active = {}
+            for joined, left, team_id, player_name in tenures:
+                if joined <= start < left:
+                    active.setdefault(team_id, []).append(player_name)
+            self._segments.append(active)
+
+    def active_at(self, when) -> dict:
+        """{team_id: [player_name, ...]} for teams with anyone active at when."""
+        if isinstance(when, str):
+            when = _parse_ts(when)
+        elif isinstance(when, datetime):
+            if when.tzinfo is None:
+                when = when.replace(tzinfo=timezone.utc)
+            when = when.timestamp()
+        return self._segments[bisect_right(self._bounds, when)]
+
+    def roster_at(self, team_id, when) -> list[str]:
+        """Player names on team_id at when."""
+        return self.active_at(when).get(team_id, [])
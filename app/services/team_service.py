@@ -92,6 +92,7 @@ class TeamService():
                 "team_name": team_name
             })
         )
+        self.invalidate_identity("team")
 
         return self.get_my_team()
 
@@ -102,97 +103,17 @@ class TeamService():
         # validate state
         if not my_league:
             raise Exception("You are not in a league!")
-        if not self.get_my_team():
+        if not my_team:
             raise Exception("You do not have a team!")
 
-        # check if its the clients turn to pick
-        league = self.verify_query(
-            self.supabase
-            .table("leagues")
-            .select("draft_order, pick_turn, pick_direction, locked, draft_complete")
-            .eq("league_id", my_league)
-        ).data
-
-        if league[0]["locked"] == False:
-            raise Exception("The draft hasn't begun yet!")
-
-        if league[0]["draft_complete"] == True:
-            raise Exception("The draft is over!")
-
-        if league[0]["pick_turn"] != self.user_id:
-            raise Exception("It's not your turn to pick a player!")
-        
-        # check if player exists
-        result = self.verify_query(
-            self.supabase
-            .table("players")
-            .select("name")
-            .eq("name", player_name)
-        )
-
-        if not result.data:
-            raise Exception("Entered player is not in the player pool!")
-        
-        # check player is available and team has room
-        taken_players = self.verify_query(
-            self.supabase
-            .table("team_players")
-            .select("player_name, team_id, left_at")
-            .eq("league_id", my_league)
-        )
-        
-        team_player_count = sum(
-            1 for row in taken_players.data if row["team_id"] == my_team and row["left_at"] == None
-        )
-
-        if team_player_count == 5:
-            raise Exception("This team is full!")
-        if player_name in {row["player_name"] for row in taken_players.data}:
-            raise Exception("This player has already been picked!")
-        
-        # update pick turn with snake draft logic
-        draft_order = league[0]["draft_order"]
-        direction = league[0]["pick_direction"]
-        current = league[0]["pick_turn"]
-
-        idx = draft_order.index(current)
-        next_idx = idx + direction
-
-        if next_idx >= len(draft_order) or next_idx < 0:
-            direction *= -1
-            next_idx = idx
-
-            if direction == -1 and team_player_count == 4:
-                self.verify_query(
-                    self.supabase
-                    .table("leagues")
-                    .update({
-                        "draft_complete": True
-                    })
-                    .eq("league_id", my_league)
-                )
+        # turn, availability, roster size and the snake order advance are all
+        # checked and applied in one transaction (admin/sql/draft_pick.sql)
+        try:
+            self.supabase.rpc("draft_pick", {
+                "p_user_id": self.user_id,
+                "p_player_name": player_name
+            }).execute()
+        except Exception as e:
+            raise Exception(getattr(e, "message", None) or str(e))
 
-        next_pick = draft_order[next_idx]
-            
-        self.verify_query(
-            self.supabase
-            .table("leagues")
-            .update({
-                "pick_turn": next_pick,
-                "pick_direction": direction
-            })
-            .eq("league_id", my_league)
-        )
-    
-        # insert player into table
-        self.verify_query(
-            self.supabase
-            .table("team_players")
-            .insert({
-                "league_id": my_league,
-                "team_id": self.get_my_team(),
-                "player_name": player_name,
-                })
-            )
-        
         return True
@@ -61,27 +61,11 @@ class TradeService():
         if not league_id:
             raise Exception("You are not in a league.")
 
-        # get all claimed players in this league
-        claimed = self.verify_query(
-            self.supabase
-            .table("team_players")
-            .select("player_name")
-            .eq("league_id", league_id)
-            .is_("left_at", None)
+        # anti-join against the league's active rosters (admin/sql/get_pool_players.sql)
+        result = self.verify_query(
+            self.supabase.rpc("get_pool_players", {"p_league_id": league_id})
         )
-        claimed_names = [p["player_name"] for p in claimed.data] if claimed else []
-
-        if claimed_names:
-            # get all players not in claimed list
-            result = self.verify_query(
-                self.supabase
-                .table("players")
-                .select("*")
-                .not_.in_("name", claimed_names)
-            )
-            return result.data if result else []
-        else:
-            return []
+        return result.data if result else []
 
     def get_trade_history(self):
         league_id = self.get_my_league()
@@ -98,102 +82,17 @@ class TradeService():
         return result.data if result else []
 
     def create_player_request(self, initiator_id, receiver_id, initiator_player, receiver_player):
-        now = datetime.now(timezone.utc).isoformat()
-
-        # get current trade window
-        window = self.verify_query(
-            self.supabase
-            .table("trade_windows")
-            .select("*")
-            .lte("start_date", now)
-            .gte("end_date", now)
-            .limit(1)
-        )
-        if not window or not window.data:
-            raise Exception("You are not in an active trade window!")
-        window_id = window.data[0]["id"]
-
-        # verify both users are in the same league
-        initiator_league = self.get_my_league()
-        if not initiator_league:
-            raise Exception("You are not in a league!")
-
-        receiver_data = self.verify_query(
-            self.supabase
-            .table("managers")
-            .select("league_id")
-            .eq("user_id", receiver_id)
-            .single()
-        )
-        if not receiver_data or not receiver_data.data:
-            raise Exception("Receiver not found.")
-        if receiver_data.data["league_id"] != initiator_league:
-            raise Exception("You are not in the same league as the receiver!")
-
-        # verify initiator owns initiator_player
-        initiator_team = self.get_my_team()
-        if not initiator_team:
-            raise Exception("You do not have a team!")
-
-        if not self.verify_query(
-            self.supabase
-            .table("team_players")
-            .select("roster_id")
-            .eq("team_id", initiator_team)
-            .eq("player_name", initiator_player)
-            .is_("left_at", None)
-        ).data:
-            raise Exception(f"You do not own {initiator_player}!")
-
-        # verify receiver owns receiver_player
-        receiver_team = self.verify_query(
-            self.supabase
-            .table("teams")
-            .select("team_id")
-            .eq("league_id", initiator_league)
-            .eq("team_owner", receiver_id)
-            .single()
-        )
-        if not receiver_team or not receiver_team.data:
-            raise Exception("Receiver does not have a team!")
-        receiver_team_id = receiver_team.data["team_id"]
-
-        if not self.verify_query(
-            self.supabase
-            .table("team_players")
-            .select("roster_id")
-            .eq("team_id", receiver_team_id)
-            .eq("player_name", receiver_player)
-            .is_("left_at", None)
-        ).data:
-            raise Exception(f"Receiver does not own {receiver_player}!")
-
-        # verify trade limits for both users
-        for user_id, label in [(initiator_id, "You have"), (receiver_id, "Receiver has")]:
-            count = self.verify_query(
-                self.supabase
-                .table("trades")
-                .select("trade_id")
-                .eq("league_id", initiator_league)
-                .eq("trade_window_id", window_id)
-                .or_(f"initiator_id.eq.{user_id},receiver_id.eq.{user_id}")
-            )
-            if count and len(count.data) >= 2:
-                raise Exception(f"{label} reached the trade limit for this window.")
-
-        # create the request
-        self.verify_query(
-            self.supabase
-            .table("trade_requests")
-            .insert({
-                "initiator_id": initiator_id,
-                "receiver_id": receiver_id,
-                "league_id": initiator_league,
-                "initiator_player": initiator_player,
-                "receiver_player": receiver_player,
-                "trade_window_id": window_id,
-            })
-        )
+        # window, league, ownership and trade limit checks run server side in
+        # the same transaction as the insert (admin/sql/create_trade_request.sql)
+        try:
+            self.supabase.rpc("create_trade_request", {
+                "p_initiator_id": initiator_id,
+                "p_receiver_id": receiver_id,
+                "p_initiator_player": initiator_player,
+                "p_receiver_player": receiver_player,
+            }).execute()
+        except Exception as e:
+            raise Exception(getattr(e, "message", None) or str(e))
 
         return True
 